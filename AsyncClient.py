@@ -0,0 +1,204 @@
+import sys
+import json
+import asyncio
+import weakref
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+CONCURRENCY = 100 # maximum number of queries in flight
+
+class AsyncClient:
+    '''
+    description: asyncio client of the GitHub API, with the same results as the synchronous QueryUser and QueryEvents
+                 of rabbit. The queries are made by those functions in the threads of the default executor of the event
+                 loop, so that they share the HTTP sessions, the response cache and the rate limit budgets of the API keys
+                 (KeyPool) with the synchronous callers. At most concurrency queries are in flight: the other ones wait
+                 on a semaphore without holding a thread, and a cancelled query that did not start yet is never sent.
+                 A query that is already sent completes in its thread and its response is only used for the rate limit
+                 accounting. The threads of the default executor also bound the queries in flight, a larger executor can
+                 be set with loop.set_default_executor.
+                 The client holds no thread and no event loop object, it can be used from several event loops: the
+                 semaphore of each loop is created the first time the client is used in it.
+                 The queried server is rabbit.QUERY_ROOT, which can point to a local fake GitHub server (see FakeGitHub).
+    '''
+
+    def __init__(self, query_user, query_events, concurrency=CONCURRENCY):
+        '''
+        args: query_user (function) - synchronous query of the type of a contributor (rabbit.QueryUser)
+              query_events (function) - synchronous query of a page of events of a contributor (rabbit.QueryEvents)
+              concurrency (int) - maximum number of queries in flight in each event loop
+        '''
+
+        self.query_user_function = query_user
+        self.query_events_function = query_events
+        self.concurrency = concurrency
+        self._semaphores = weakref.WeakKeyDictionary() # semaphore of each event loop
+        self._lock = threading.Lock()
+
+    def semaphore(self):
+        '''
+        args: None
+
+        returns: semaphore (asyncio.Semaphore) - the semaphore of the running event loop, created if needed
+        '''
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if loop not in self._semaphores:
+                self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+
+            return(self._semaphores[loop])
+
+    async def run(self, function, *args):
+        '''
+        args: function (function) - synchronous query function
+              args - arguments of the query function
+
+        returns: result - the result of the query function
+        '''
+
+        async with self.semaphore():
+            return(await asyncio.to_thread(function, *args))
+
+    async def query_user(self, contributor, key, max_queries):
+        '''
+        args: contributor (str) - contributor name
+              key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+              max_queries (int) - maximum number of queries per contributor
+
+        returns: contributor_type (str) - type of the contributor (e.g., "Bot", "User", "Organization")
+                 query_failed (bool) - a boolean value to indicate if the query failed or success
+        '''
+
+        return(await self.run(self.query_user_function, contributor, key, max_queries))
+
+    async def query_events(self, contributor, key, page, max_queries):
+        '''
+        args: contributor (str) - contributor name
+              key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+              page (int) - the events page number to be queried
+              max_queries (int) - maximum number of queries per contributor
+
+        returns: df_events (DataFrame) - the events that were performed by contributor (one row per event, newest first)
+                 query_failed (bool) - a boolean value to indicate if the query failed or success
+        '''
+
+        return(await self.run(self.query_events_function, contributor, key, page, max_queries))
+
+    async def query_all_events(self, contributor, key, max_queries):
+        '''
+        args: contributor (str) - contributor name
+              key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+              max_queries (int) - maximum number of queries per contributor
+
+        returns: pages (list) - (df_events, query_failed) of each queried page, in the order of the pages
+
+        description: Query the pages of events one after another, until a page is not full or max_queries pages are queried.
+        '''
+
+        pages = []
+        for page in range(1, max_queries+1):
+            df_events, query_failed = await self.query_events(contributor, key, page, max_queries)
+            pages.append((df_events, query_failed))
+            if query_failed or len(df_events) < 100:
+                break
+
+        return(pages)
+
+class FakeGitHub:
+    '''
+    description: Local HTTP server with the /users/<login> and /users/<login>/events endpoints of the GitHub API, serving
+                 the given types and events, to run the client without querying GitHub. The logins that are not given are
+                 answered with 404, as GitHub does for the logins that do not exist.
+    '''
+
+    def __init__(self, types, events):
+        '''
+        args: types (dict) - type of each login (e.g., "User", "Organization")
+              events (dict) - events of each login, from the most recent to the oldest as the GitHub Events API reports them
+        '''
+
+        fake = self
+        self.types = types
+        self.events = events
+        self.queries = 0
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                fake.queries = fake.queries + 1
+                url = urlparse(self.path)
+                parts = url.path.strip('/').split('/')
+                if len(parts) < 2 or parts[0] != 'users' or parts[1] not in fake.types:
+                    self.respond(404, {'message': 'Not Found'})
+                elif len(parts) == 2:
+                    self.respond(200, {'login': parts[1], 'type': fake.types[parts[1]]})
+                else:
+                    page = int(parse_qs(url.query).get('page', ['1'])[0])
+                    self.respond(200, fake.events.get(parts[1], [])[(page-1)*100:page*100])
+            def respond(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.send_header('X-RateLimit-Remaining', '5000')
+                self.send_header('X-RateLimit-Reset', '0')
+                self.end_headers()
+                self.wfile.write(data)
+            def log_message(self, format, *args):
+                pass
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}'
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        self._server.shutdown()
+        self._server.server_close()
+
+def main():
+    '''
+    args: None
+
+    returns: None
+
+    description: Query a local fake GitHub server (see FakeGitHub) for synthetic contributors with the client, from two event loops,
+                 and with the synchronous QueryUser and QueryEvents. Exit with status 1 if the results differ.
+    '''
+
+    import rabbit # only needed for the run, rabbit imports this module
+    import SyntheticEvents as sev
+    types = {'alice': 'User', 'bob': 'User', 'carol': 'User', 'dependabot[bot]': 'Bot', 'acme': 'Organization'}
+    events = {login: sev.generate_events(login, num_events, seed)
+              for seed, (login, num_events) in enumerate([('alice', 250), ('bob', 120), ('carol', 0)])}
+    logins = list(types) + ['nobody'] # nobody is answered with 404
+    fake = FakeGitHub(types, events)
+    rabbit.QUERY_ROOT = fake.url
+    client = rabbit.create_async_client(concurrency=4)
+    try:
+        expected = [(rabbit.QueryUser(login, None, 3), [(len(df_events), query_failed) for df_events, query_failed in
+                                                         [rabbit.QueryEvents(login, None, page, 3) for page in range(1, 4)]])
+                    for login in logins]
+        async def query(login):
+            contributor_type, query_failed = await client.query_user(login, None, 3)
+            pages = await client.query_all_events(login, None, 3)
+            return((contributor_type, query_failed), [(len(df_events), query_failed) for df_events, query_failed in pages])
+        async def query_all():
+            return(await asyncio.gather(*[query(login) for login in logins]))
+        mismatches = []
+        for _ in range(2): # asyncio.run creates a new event loop each time
+            for login, (user, pages), (expected_user, expected_pages) in zip(logins, asyncio.run(query_all()), expected):
+                if user != expected_user or pages != expected_pages[:len(pages)]:
+                    mismatches.append(login)
+    finally:
+        fake.close()
+    print(f'{len(mismatches)} of {2*len(logins)} asynchronous queries differ from QueryUser and QueryEvents ({fake.queries} queries)' +
+          (f': {mismatches}' if len(mismatches) > 0 else ''))
+    sys.exit(1 if len(mismatches) > 0 else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import os
+import json
+import pandas as pd
+
+class CheckpointJournal:
+    '''
+    description: Journal of the results of the contributors whose type is determined, to resume an interrupted run.
+                 The first line of the journal records the settings of the run, each following line records the
+                 result of a contributor in JSON. Each line is written to disk before the next contributor is reported,
+                 so that at most the contributors being processed when the run is interrupted are processed again.
+    '''
+
+    def __init__(self, journal_path, settings, resume=False):
+        '''
+        args: journal_path (str) - path of the journal file
+              settings (dict) - settings of the run, a run can only be resumed with the same settings
+              resume (bool) - If True, the results of the journal are kept and new results are appended.
+                              Otherwise, the journal is started anew.
+        '''
+
+        self.journal_path = journal_path
+        self.completed = [] # (login, result) of the contributors recorded in the journal
+        if resume and os.path.exists(journal_path):
+            self.completed, recorded_size = self.read(journal_path, settings)
+            self._file = open(journal_path, 'r+', encoding='utf-8')
+            self._file.truncate(recorded_size) # remove what was partially written when the run was interrupted
+            self._file.seek(recorded_size)
+            if recorded_size == 0:
+                self.append(settings)
+        else:
+            self._file = open(journal_path, 'w', encoding='utf-8')
+            self.append(settings)
+
+    @staticmethod
+    def read(journal_path, settings):
+        '''
+        args: journal_path (str) - path of the journal file
+              settings (dict) - settings of the run to resume
+
+        returns: completed (list) - (login, result) of the contributors recorded in the journal, in the order of the journal
+                 recorded_size (int) - size (in bytes) of the complete lines of the journal, 0 if the settings were not fully
+                                       written when the run was interrupted (the journal is then started anew)
+        '''
+
+        completed = []
+        with open(journal_path, 'rb') as journal_file:
+            lines = journal_file.read().split(b'\n')
+        if len(lines) == 1: # the journal is empty, or its first line is partially written
+            return(completed, 0)
+        try:
+            recorded_settings = json.loads(lines[0])
+        except ValueError:
+            recorded_settings = None
+        if recorded_settings != settings:
+            raise ValueError(f'The run recorded in {journal_path} was made with other settings ({lines[0].decode()}), it cannot be resumed.')
+        recorded_size = len(lines[0]) + 1
+        for line in lines[1:-1]: # the last line is empty, or partially written when the run was interrupted
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            completed.append((entry['login'], entry['result']))
+            recorded_size = recorded_size + len(line) + 1
+
+        return(completed, recorded_size)
+
+    def append(self, entry):
+        '''
+        args: entry (dict) - entry to record
+
+        returns: None
+        '''
+
+        self._file.write(json.dumps(entry, default=lambda value: value.item()) + '\n') # numpy scalars
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def record(self, results):
+        '''
+        args: results (DataFrame) - results of one or more contributors, indexed by login
+
+        returns: None
+        '''
+
+        for login, result in zip(results.index, results.to_dict(orient='records')):
+            self.append({'login': str(login), 'result': result})
+
+    def completed_results(self):
+        '''
+        args: None
+
+        returns: results (DataFrame) - results of the contributors recorded in the journal, None if there is none
+        '''
+
+        if len(self.completed) == 0:
+            return(None)
+
+        return(pd.DataFrame([result for login, result in self.completed], index=[login for login, result in self.completed]))
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        self._file.close()
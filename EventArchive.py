@@ -0,0 +1,172 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+
+DATA_FILE = 'events.jsonl.gz' # pages of events, one gzip member per page
+INDEX_FILE = 'index.jsonl' # location of each page in the data file
+
+class EventArchive:
+    '''
+    description: On-disk archive of the raw pages of events queried from the GitHub Events API, so that the type of the
+                 contributors can be determined again (e.g., after a change of the activity rules or of the model) without
+                 querying the API. Each page is appended to the data file as its own gzip member with one JSON line
+                 {login, page, fetched_at, events}, the data file is therefore a regular compressed JSON Lines file.
+                 The index file records, for each page, its offset and length in the data file, so that the pages of a
+                 login are read without decompressing the other ones. Querying the first page of a login again starts
+                 a new set of pages for this login: only the pages of its most recent query are used. The index file also
+                 records the type of each login reported by the /users endpoint (or Invalid if the query failed), so that
+                 the logins that are not users are reported with the same type when the types are determined again.
+    '''
+
+    def __init__(self, archive_dir, read_only=False):
+        '''
+        args: archive_dir (str) - directory of the archive, created if needed unless read_only
+              read_only (bool) - If True, the archive is only read, and it must exist
+        '''
+
+        self.archive_dir = archive_dir
+        if not read_only:
+            os.makedirs(archive_dir, exist_ok=True)
+        elif not os.path.isdir(archive_dir):
+            raise FileNotFoundError(f'There is no event archive in {archive_dir}.')
+        self._lock = threading.Lock()
+        self.index, self.types = self.read_index(os.path.join(archive_dir, INDEX_FILE))
+        self._data_file = open(os.path.join(archive_dir, DATA_FILE), 'rb' if read_only else 'ab+')
+        self._index_file = None if read_only else open(os.path.join(archive_dir, INDEX_FILE), 'a', encoding='utf-8')
+
+    @staticmethod
+    def read_index(index_path):
+        '''
+        args: index_path (str) - path of the index file
+
+        returns: index (dict) - for each login, the location (offset, length, digest) of each page of their most recent query
+                 types (dict) - most recent type of each login whose type is archived
+        '''
+
+        index = {}
+        types = {}
+        if not os.path.exists(index_path):
+            return(index, types)
+        with open(index_path, encoding='utf-8') as index_file:
+            for line in index_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue # a line that was not fully written when the run was interrupted
+                if 'type' in entry:
+                    types[entry['login']] = entry['type']
+                    continue
+                if entry['page'] == 1:
+                    index[entry['login']] = {}
+                index.setdefault(entry['login'], {})[entry['page']] = entry
+
+        return(index, types)
+
+    def store(self, login, page, json_response):
+        '''
+        args: login (str) - login name of the contributor
+              page (int) - number of the page of events
+              json_response (list) - the events of the page, as reported by the GitHub Events API
+
+        returns: None
+
+        description: Archive the page, unless the same page with the same events is already the one of the index
+        '''
+
+        record = json.dumps({'login': login, 'page': page, 'fetched_at': time.time(), 'events': json_response}, separators=(',', ':'))
+        digest = hashlib.sha1(json.dumps(json_response, separators=(',', ':')).encode('utf-8')).hexdigest()
+        data = gzip.compress((record + '\n').encode('utf-8'))
+        with self._lock:
+            entry = self.index.get(login, {}).get(page)
+            if entry is not None and entry['digest'] == digest:
+                return
+            self._data_file.seek(0, os.SEEK_END)
+            entry = {'login': login, 'page': page, 'offset': self._data_file.tell(), 'length': len(data), 'digest': digest}
+            self._data_file.write(data)
+            self._data_file.flush()
+            self._index_file.write(json.dumps(entry) + '\n')
+            self._index_file.flush()
+            if page == 1:
+                self.index[login] = {}
+            self.index.setdefault(login, {})[page] = entry
+
+    def store_type(self, login, contributor_type):
+        '''
+        args: login (str) - login name of the contributor
+              contributor_type (str) - type of the contributor (e.g., "User", "Organization"), Invalid if the query failed
+
+        returns: None
+        '''
+
+        with self._lock:
+            if self.types.get(login) == contributor_type:
+                return
+            self._index_file.write(json.dumps({'login': login, 'type': contributor_type}) + '\n')
+            self._index_file.flush()
+            self.types[login] = contributor_type
+
+    def get_type(self, login):
+        '''
+        args: login (str) - login name of the contributor
+
+        returns: contributor_type (str) - the archived type of the contributor, None if it is not archived
+        '''
+
+        return(self.types.get(login))
+
+    def read_page(self, entry):
+        '''
+        args: entry (dict) - location of the page in the data file, from the index
+
+        returns: events (list) - the events of the page
+        '''
+
+        with self._lock:
+            self._data_file.seek(entry['offset'])
+            data = self._data_file.read(entry['length'])
+
+        return(json.loads(gzip.decompress(data))['events'])
+
+    def logins(self):
+        '''
+        args: None
+
+        returns: logins (list) - login names of the contributors whose events or type are archived, in alphabetical order
+        '''
+
+        return(sorted(set(self.index) | set(self.types)))
+
+    def get(self, login, default=None):
+        '''
+        args: login (str) - login name of the contributor
+              default - returned if the events of the contributor are not archived
+
+        returns: events (list) - the archived events of the contributor, from the most recent to the oldest as the GitHub
+                                 Events API reports them. The pages are read in order until a page is missing.
+        '''
+
+        pages = self.index.get(login)
+        if pages is None:
+            return(default)
+        events = []
+        page = 1
+        while page in pages:
+            events.extend(self.read_page(pages[page]))
+            page = page + 1
+
+        return(events)
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        with self._lock:
+            self._data_file.close()
+            if self._index_file is not None:
+                self._index_file.close()
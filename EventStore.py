@@ -0,0 +1,167 @@
+import json
+import time
+import sqlite3
+import threading
+import numpy as np
+import pandas as pd
+
+EVENTS_RETENTION = 90 # days during which the GitHub Events API reports an event
+
+class EventStore:
+    '''
+    description: SQLite store of the events of each contributor, keyed by (login, event_id) and indexed on their creation time.
+                 The GitHub Events API only reports the events of the last 90 days, up to 300 events. With the store, only the
+                 events that are newer than the stored ones are queried, and the events that are not reported anymore by the
+                 API remain available, so that contributors with few recent events are identified through a longer history.
+                 The events are stored as unpacked by ExtractEvent, one JSON object per event.
+    '''
+
+    def __init__(self, store_path):
+        '''
+        args: store_path (str) - path of the SQLite database, created if needed
+        '''
+
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(store_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS events (login TEXT, event_id TEXT, created_at TEXT, event TEXT, \
+PRIMARY KEY (login, event_id))')
+            self._connection.execute('CREATE INDEX IF NOT EXISTS events_created_at ON events (login, created_at)')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS logins (login TEXT PRIMARY KEY, fetched_at REAL)')
+
+    def event_ids(self, login):
+        '''
+        args: login (str) - login name of the contributor
+
+        returns: event_ids (set) - ids of the stored events of the contributor
+        '''
+
+        with self._lock:
+            rows = self._connection.execute('SELECT event_id FROM events WHERE login = ?', (login,)).fetchall()
+
+        return({row[0] for row in rows})
+
+    def fetched_at(self, login):
+        '''
+        args: login (str) - login name of the contributor
+
+        returns: fetched_at (float) - time.time() at which the events of the contributor were last queried, None if they never were
+        '''
+
+        with self._lock:
+            row = self._connection.execute('SELECT fetched_at FROM logins WHERE login = ?', (login,)).fetchone()
+        if row is None:
+            return(None)
+
+        return(row[0])
+
+    def is_contiguous(self, login, known_reached, history_exhausted):
+        '''
+        args: login (str) - login name of the contributor
+              known_reached (bool) - If True, the queried events reached an event that is already stored
+              history_exhausted (bool) - If True, the GitHub Events API reported all the events it has for the contributor
+
+        returns: contiguous (bool) - True if no event is missing between the queried events and the stored ones
+
+        description: If the API reported all its events without reaching a stored one, the stored events are older than 90 days.
+                     No event can then be missing if the events were last queried less than 90 days ago.
+        '''
+
+        if known_reached:
+            return(True)
+        fetched_at = self.fetched_at(login)
+
+        return(history_exhausted and fetched_at is not None and time.time() - fetched_at < EVENTS_RETENTION*24*3600)
+
+    def store(self, login, df_events, replace=False):
+        '''
+        args: login (str) - login name of the contributor
+              df_events (DataFrame) - events of the contributor, unpacked by ExtractEvent.unpackJson
+              replace (bool) - If True, the stored events of the contributor are replaced, otherwise the events are added to them
+
+        returns: None
+        '''
+
+        rows = []
+        for event in df_events.to_dict('records'):
+            # the missing values are stored as null, so that the columns that only have missing values are kept (see history)
+            event = {column: None if isinstance(value, float) and np.isnan(value) else value for column, value in event.items()}
+            rows.append((login, str(event['event_id']), event['created_at'], json.dumps(event, default=lambda value: value.item())))
+        with self._lock, self._connection:
+            if replace:
+                self._connection.execute('DELETE FROM events WHERE login = ?', (login,))
+            self._connection.executemany('INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?)', rows)
+            self._connection.execute('INSERT OR REPLACE INTO logins VALUES (?, ?)', (login, time.time()))
+
+    def history(self, login, max_events):
+        '''
+        args: login (str) - login name of the contributor
+              max_events (int) - maximum number of events
+
+        returns: df_events (DataFrame) - the max_events most recent stored events of the contributor, from the most recent to the
+                                         oldest as the GitHub Events API reports them, with the columns of the stored events
+        '''
+
+        with self._lock:
+            rows = self._connection.execute('SELECT event FROM events WHERE login = ? ORDER BY created_at DESC, CAST(event_id AS INTEGER) DESC \
+LIMIT ?', (login, max_events)).fetchall()
+
+        return(pd.DataFrame([json.loads(row[0]) for row in rows]))
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        with self._lock:
+            self._connection.close()
+
+def main():
+    '''
+    args: None
+
+    returns: None
+
+    description: Determine the features of synthetic contributors served by a local fake GitHub server (see AsyncClient.FakeGitHub)
+                 with an event store, then again once no new event is reported, and without the store. Exit with status 1 if
+                 the results differ. The prediction is deferred, the type only depends on the features.
+    '''
+
+    import os
+    import sys
+    import tempfile
+    import warnings
+    import rabbit # only needed for the run, rabbit imports this module
+    import AsyncClient as acl
+    import SyntheticEvents as sev
+    logins = [f'u{seed}' for seed in range(20)]
+    events = {login: sev.generate_events(login, 120 + 10*seed, seed) for seed, login in enumerate(logins)}
+    for login in logins[::2]: # only open issues, their issue_closed_at column only has nulls
+        for event in events[login]:
+            if 'issue' in event['payload']:
+                event['payload']['issue']['closed_at'] = None
+    fake = acl.FakeGitHub({login: 'User' for login in logins}, events)
+    rabbit.QUERY_ROOT = fake.url
+    mismatches = []
+    with tempfile.TemporaryDirectory() as store_dir, warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            runs = []
+            for store_path in [os.path.join(store_dir, 'events.db'), os.path.join(store_dir, 'events.db'), None]:
+                rabbit.configure_event_store(store_path)
+                runs.append([rabbit.MakePrediction(login, None, 5, 1.0, 3, True, defer_prediction=True) for login in logins])
+            rabbit.configure_event_store(None)
+        finally:
+            fake.close()
+    for login, first, again, without_store in zip(logins, *runs):
+        if not (first.equals(again) and first.equals(without_store)):
+            mismatches.append(login)
+    print(f'{len(mismatches)} of {len(logins)} contributors have another result once no new event is reported, or without the store' +
+          (f': {mismatches}' if len(mismatches) > 0 else ''))
+    sys.exit(1 if len(mismatches) > 0 else 0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+import os
+import gzip
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+ARCHIVE_EVENTS = 300 # number of most recent events kept per contributor, as many as the GitHub Events API reports
+
+def event_order(event):
+    '''
+    args: event (dict) - an event of GH Archive
+
+    returns: order (tuple) - creation time and id of the event, the most recent event has the largest order
+    '''
+
+    event_id = event.get('id')
+
+    return((event.get('created_at') or '', int(event_id) if str(event_id).isdigit() else 0))
+
+def keep_recent(events, max_events):
+    '''
+    args: events (list) - events of a contributor
+          max_events (int) - maximum number of events to keep
+
+    returns: events (list) - the max_events most recent events, from the most recent to the oldest as the GitHub Events API reports them.
+                             An event found in several files is only kept once.
+    '''
+
+    events = {event.get('id'): event for event in events}.values()
+
+    return(sorted(events, key=event_order, reverse=True)[:max_events])
+
+def read_archive(archive_path, logins=None, max_events=ARCHIVE_EVENTS):
+    '''
+    args: archive_path (str) - path of a GH Archive file (one JSON event per line, gzip compressed if it ends with .gz)
+          logins (set) - login names of the contributors whose events are kept, None to keep the events of all the contributors
+          max_events (int) - maximum number of events kept per contributor
+
+    returns: archive (dict) - events of each contributor of the file, from the most recent to the oldest
+    '''
+
+    archive = {}
+    open_file = gzip.open if archive_path.endswith('.gz') else open
+    with open_file(archive_path, 'rt', encoding='utf-8') as archive_file:
+        for line in archive_file:
+            if len(line.strip()) == 0:
+                continue
+            event = json.loads(line)
+            login = (event.get('actor') or {}).get('login')
+            if login is None or (logins is not None and login not in logins):
+                continue
+            archive.setdefault(login, []).append(event)
+
+    return({login: keep_recent(events, max_events) for login, events in archive.items()})
+
+def read_archives(archive_paths, logins=None, max_events=ARCHIVE_EVENTS, processes=None):
+    '''
+    args: archive_paths (list) - paths of GH Archive files (e.g., hourly dumps 2024-01-01-15.json.gz)
+          logins (list) - login names of the contributors whose events are kept, None to keep the events of all the contributors
+          max_events (int) - maximum number of events kept per contributor
+          processes (int) - number of processes that read the files in parallel, by default one per file up to the number of CPUs
+
+    returns: archive (dict) - the max_events most recent events of each contributor over all the files, from the most recent
+                              to the oldest, in the same format as the responses of the GitHub Events API
+
+    description: The files are decompressed and filtered in parallel, one file per process, and the events of each
+                 contributor are then merged.
+    '''
+
+    if logins is not None:
+        logins = set(logins)
+    if processes is None:
+        processes = min(len(archive_paths), os.cpu_count() or 1)
+
+    if processes <= 1 or len(archive_paths) <= 1:
+        file_archives = [read_archive(archive_path, logins, max_events) for archive_path in archive_paths]
+    else:
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as executor:
+            file_archives = list(executor.map(read_archive, archive_paths, [logins]*len(archive_paths), [max_events]*len(archive_paths)))
+
+    archive = {}
+    for file_archive in file_archives:
+        for login, events in file_archive.items():
+            archive.setdefault(login, []).extend(events)
+
+    return({login: keep_recent(events, max_events) for login, events in archive.items()})
@@ -7,39 +7,81 @@ general = ['date','activity','contributor','repository']
 event_general = ['event_id','event_type','login','repository','created_at']
 UPPER_TIME_THRESHOLD = '0 days 00:00:02'
 LOWER_TIME_THRESHOLD = '-1 days +23:59:58'
+# activities that correspond to exactly one event, identified by the event type qualified by the ref_type (CreateEvent and
+# DeleteEvent) or the action (PullRequestEvent)
+SIMPLE_ACTIVITIES = {'CreateEvent/repository': 'Creating repository',
+                     'CreateEvent/branch': 'Creating branch',
+                     'DeleteEvent/tag': 'Deleting tag',
+                     'DeleteEvent/branch': 'Deleting branch',
+                     'PublicEvent': 'Making repository public',
+                     'MemberEvent': 'Adding collaborator to repository',
+                     'ForkEvent': 'Forking repository',
+                     'WatchEvent': 'Starring repository',
+                     'GollumEvent': 'Editing wiki page',
+                     'CommitCommentEvent': 'Commenting commit',
+                     'PullRequestEvent/opened': 'Opening pull request'}
+# order of the activities in the DataFrame of activity_identification, the order in which the activities were identified one
+# type after the other when the features of the model were computed (extract_features sorts them by date, the order of the
+# activities of the same second changes the features of the runs of activities, e.g., DCAT)
+ACTIVITY_ORDER = {activity: rank for rank, activity in enumerate([
+    'Creating repository', 'Creating branch', 'Publishing a release', 'Creating tag', 'Deleting tag', 'Deleting branch',
+    'Making repository public', 'Adding collaborator to repository', 'Forking repository', 'Starring repository',
+    'Editing wiki page', 'Transferring issue', 'Opening issue', 'Closing issue', 'Reopening issue', 'Commenting issue',
+    'Opening pull request', 'Reopening pull request', 'Closing pull request', 'Commenting pull request',
+    'Commenting pull request changes', 'Reviewing code', 'Commenting commit', 'Pushing commits'])}
 
 '''
 Identifying activities from events
 '''
-def CreatingRepository(df_events, list_event_id_covered, df_all_activities):
+def SimpleActivities(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
+
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-    
-    Creating repository: Filter data based on CreateEvent with ref_type as repository
-    '''
+             event_id_covered - Updated set of event id's that are covered in previous iterations
+
+    Activities that correspond to exactly one event, identified in a single pass over the events through SIMPLE_ACTIVITIES:
+    Creating repository: CreateEvent with ref_type as repository
+    Creating branch: CreateEvent with ref_type as branch
+    Deleting tag: DeleteEvent with ref_type as tag
+    Deleting branch: DeleteEvent with ref_type as branch
+    Making repository public: PublicEvent
+    Adding collaborator to repository: MemberEvent
+    Forking a repository: ForkEvent
+    Starring a repository: WatchEvent
+    Editing a wiki page: GollumEvent
+    Commenting commits: CommitCommentEvent
+    Opening pull request: PullRequestEvent with action as opened
+    '''
+    event_key = df_events['event_type']
+    if(df_events.columns.isin(['ref_type']).any()):
+        event_key = event_key.mask(event_key.isin(['CreateEvent','DeleteEvent']), event_key + '/' + df_events['ref_type'].astype(str))
+    if(df_events.columns.isin(['action']).any()):
+        event_key = event_key.mask(event_key == 'PullRequestEvent', event_key + '/' + df_events['action'].astype(str))
+    activity = event_key.map(SIMPLE_ACTIVITIES)
+    is_simple = activity.notnull().to_numpy()
+    if(not is_simple.any()):
+        return df_all_activities, event_id_covered
 
-    create_repository = (
+    simple_activities = (
         df_events
-        [event_general+['ref_type']]
-        .assign(activity='Creating repository')
+        [is_simple]
+        [event_general]
+        .assign(activity=activity[is_simple].to_numpy()) # the index of the events may have duplicates
         .rename(columns={'login':'contributor',
                          'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
     )
-    list_event_id_covered.extend(create_repository['event_id'].to_list())
 
-    create_repository=create_repository.sort_values('date')
+    event_id_covered.update(simple_activities['event_id'].to_list())
 
-    df_all_activities = pd.concat([df_all_activities,create_repository.drop_duplicates()[general]])
+    df_all_activities = merge_misc_related(df_all_activities, simple_activities)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
 def merge_misc_related(df_all, df):
     '''
@@ -55,43 +97,14 @@ def merge_misc_related(df_all, df):
 
     return(df_all)
 
-def CreateBranch(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Creating branch: Filter data based on CreateEvent and ref_type as branch
-    '''
-    
-    create_branch = (
-        df_events
-        [event_general]
-        .assign(activity = 'Creating branch')
-        .rename(columns={'login':'contributor', 
-                         'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .assign(type="branch")
-        .drop_duplicates()
-        .sort_values('date')
-    )
-    list_event_id_covered.extend(create_branch['event_id'].to_list())
-    
-    df_all_activities = merge_misc_related(df_all_activities, create_branch)
-
-    return df_all_activities, list_event_id_covered
-
-def PublishingRelease(df_events, list_event_id_covered, df_all_activities):
+def PublishingRelease(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
     
     Publishing a release:
     Some Releases have a new tag that is created at the moment of creating the release, 
@@ -175,15 +188,15 @@ def PublishingRelease(df_events, list_event_id_covered, df_all_activities):
             df_release_with_create=df_release_with_create[(df_release_with_create['time_diff'] <= UPPER_TIME_THRESHOLD) & 
                                                         (df_release_with_create['time_diff'] >= LOWER_TIME_THRESHOLD)]
         
-            list_event_id_covered.extend(df_release_with_create['event_id'].to_list())
-            list_event_id_covered.extend(df_release_with_create['cr_event_id'].to_list())
+            event_id_covered.update(df_release_with_create['event_id'].to_list())
+            event_id_covered.update(df_release_with_create['cr_event_id'].to_list())
         
             df_release_with_create_proc = (
                 df_release_with_create
                 .rename(columns={'login': 'contributor', 
                                 'created_at': 'date'})
                 .assign(activity='Publishing a release')
-                .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+                .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
                 [general+['release_node_id']]
                 .drop_duplicates()
                 .sort_values('date')
@@ -196,13 +209,13 @@ def PublishingRelease(df_events, list_event_id_covered, df_all_activities):
     '''
     df_release_without_create = (
         df_events
-        .query('event_type == "ReleaseEvent" and event_id not in @list_event_id_covered')
+        .query('event_type == "ReleaseEvent" and event_id not in @event_id_covered')
         [event_general+['release_node_id']]
         .sort_values(['login','repository','created_at'])
     )
 
     if(df_release_without_create.shape[0]>0):
-        list_event_id_covered.extend(df_release_without_create['event_id'].to_list())
+        event_id_covered.update(df_release_without_create['event_id'].to_list())
     
         df_release_without_create_proc = (
             df_release_without_create
@@ -211,7 +224,7 @@ def PublishingRelease(df_events, list_event_id_covered, df_all_activities):
                              'release_node_id': 'GH_node'})
             [['contributor','repository','date','GH_node']]
             .assign(activity='Publishing a release')
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .drop_duplicates()
             .sort_values('date')
         )
@@ -219,16 +232,16 @@ def PublishingRelease(df_events, list_event_id_covered, df_all_activities):
         df_release_without_create_proc = df_release_without_create_proc.rename(columns={'GH_node':'release_GH_node'})
         df_all_activities = pd.concat([df_all_activities, df_release_without_create_proc.drop_duplicates()[general]])
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def CreatingTag(df_events, list_event_id_covered, df_all_activities):
+def CreatingTag(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Creating tag: Get the events based on CreateEvent and ref_type as tag that were not covered as part of release activity
     '''
@@ -238,208 +251,16 @@ def CreatingTag(df_events, list_event_id_covered, df_all_activities):
         .assign(activity = 'Creating tag')
         .rename(columns={'login':'contributor',
                          'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
     )
 
-    list_event_id_covered.extend(create_tag['event_id'].to_list())
+    event_id_covered.update(create_tag['event_id'].to_list())
 
     df_all_activities = merge_misc_related(df_all_activities, create_tag)
 
-    return df_all_activities, list_event_id_covered
-
-def DeletingTag(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Deleting tag: Filter data based on DeleteEvent and ref_type as tag
-    '''
-    delete_tag = (
-        df_events
-        [event_general]
-        .assign(activity = 'Deleting tag')
-        .rename(columns={'login':'contributor',
-                         'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(delete_tag['event_id'].to_list())
-
-    df_all_activities = merge_misc_related(df_all_activities, delete_tag)
-
-    return df_all_activities, list_event_id_covered
-
-def DeletingBranch(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Deleting branch: Filter data based on DeleteEvent and ref_type as branch
-    '''
-    delete_branch = (
-        df_events
-        [event_general]
-        .assign(activity = 'Deleting branch')
-        .rename(columns={'login':'contributor',
-                         'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(delete_branch['event_id'].to_list())
-
-    df_all_activities = merge_misc_related(df_all_activities, delete_branch)
-
-    return df_all_activities, list_event_id_covered
-
-def MakingRepositoryPublic(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Making repository public: Filter data based on PublicEvent
-    '''
-    public_event = (
-        df_events
-        [event_general]
-        .assign(activity = 'Making repository public')
-        .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(public_event['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities, public_event.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
-
-def AddingCollaborator(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Adding collaborator to repository: Filter data based on MemberEvent
-    '''
-    member_event = (
-        df_events
-        [event_general]
-        .assign(activity = 'Adding collaborator to repository')
-        .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(member_event['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities, member_event.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
-
-def ForkingRepository(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Forking a repository: Filter data based on ForkEvent
-    '''
-    forking_repository = (
-        df_events
-        [event_general]
-        .assign(activity = 'Forking repository')
-        .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(forking_repository['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities, forking_repository.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
-
-def StarringRepository(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Starring a repository: Filter data based on WatchEvent
-    '''
-    starring_repository = (
-        df_events
-        [event_general]
-        .assign(activity = 'Starring repository')
-        .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(starring_repository['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities, starring_repository.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
-
-def EditingWikiPage(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Editing a wiki page: Filter events based on GollumEvent
-    '''
-    df_wiki_page = (
-        df_events
-        [event_general]
-        .rename(columns={'login':'contributor', 
-                         'created_at':'date'})
-        .assign(activity = 'Editing wiki page')
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(df_wiki_page['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities,df_wiki_page.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
 def merge_issue_related(df_all,df):
     '''
@@ -456,14 +277,14 @@ def merge_issue_related(df_all,df):
 
     return(df_all)
 
-def TransferingIssue(df_events, list_event_id_covered, df_all_activities):
+def TransferingIssue(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Transferring an issue:
     Issue is tranferred if
@@ -476,25 +297,25 @@ def TransferingIssue(df_events, list_event_id_covered, df_all_activities):
         [event_general+['issue_node_id']]
         .rename(columns={'login':'contributor', 'created_at':'date'})
         .assign(activity = 'Transferring issue')
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
     )
 
-    list_event_id_covered.extend(df_transferring_issue['event_id'].to_list())
+    event_id_covered.update(df_transferring_issue['event_id'].to_list())
 
     df_all_activities = merge_issue_related(df_all_activities,df_transferring_issue)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def OpeningIssue(df_events, list_event_id_covered, df_all_activities):
+def OpeningIssue(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Opening issue: If an issue with action opened is not covered in transferred issue then it is new
     '''
@@ -502,26 +323,26 @@ def OpeningIssue(df_events, list_event_id_covered, df_all_activities):
         df_events
         [event_general+['issue_node_id']]
         .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .assign(activity='Opening issue')
         .drop_duplicates()
         .sort_values('date')
     )
 
-    list_event_id_covered.extend(df_opening_issue['event_id'].to_list())
+    event_id_covered.update(df_opening_issue['event_id'].to_list())
 
     df_all_activities = merge_issue_related(df_all_activities,df_opening_issue)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def ClosingIssue(df_events, list_event_id_covered, df_all_activities):
+def ClosingIssue(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Closing issue: 
     1. Issue is closed with IssueCommentEvent if both the events occur within 2 seconds
@@ -597,14 +418,14 @@ def ClosingIssue(df_events, list_event_id_covered, df_all_activities):
         df_closing_issue_with_comment=df_closing_issue_with_comment[(df_closing_issue_with_comment['time_diff'] <= UPPER_TIME_THRESHOLD) & 
                                                                         (df_closing_issue_with_comment['time_diff'] >= LOWER_TIME_THRESHOLD)]
     
-        list_event_id_covered.extend(df_closing_issue_with_comment['event_id'].to_list())
-        list_event_id_covered.extend(df_closing_issue_with_comment['comm_event_id'].to_list())
+        event_id_covered.update(df_closing_issue_with_comment['event_id'].to_list())
+        event_id_covered.update(df_closing_issue_with_comment['comm_event_id'].to_list())
     
         df_closing_issue_with_comment_proc = (
             df_closing_issue_with_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Closing issue')
             [general+['issue_node_id']]
             .drop_duplicates()
@@ -618,19 +439,19 @@ def ClosingIssue(df_events, list_event_id_covered, df_all_activities):
     '''
     df_closing_issue_without_comment= (
         df_events
-        .query('event_type == "IssuesEvent" and action == "closed" and event_id not in @list_event_id_covered')
+        .query('event_type == "IssuesEvent" and action == "closed" and event_id not in @event_id_covered')
         [event_general+['issue_closed_at','issue_node_id']]
     )
     if(df_closing_issue_without_comment.shape[0]>0):
 
-        list_event_id_covered.extend(df_closing_issue_without_comment['event_id'].to_list())
+        event_id_covered.update(df_closing_issue_without_comment['event_id'].to_list())
     
         df_closing_issue_without_comment_proc = (
             df_closing_issue_without_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-            .assign(closed_at=lambda d: d.issue_closed_at.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
+            .assign(closed_at=lambda d: d.issue_closed_at.dt.tz_localize(tz='UTC'))
             .assign(activity='Closing issue')
             [general + ['issue_node_id','closed_at']]
             .drop_duplicates()
@@ -638,16 +459,16 @@ def ClosingIssue(df_events, list_event_id_covered, df_all_activities):
     
         df_all_activities = merge_issue_related(df_all_activities,df_closing_issue_without_comment_proc)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def ReopeningIssue(df_events, list_event_id_covered, df_all_activities):
+def ReopeningIssue(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
     
     Reopening an issue: 
     1. Issue is reopened with IssueCommentEvent if both the events occur within 2 seconds
@@ -729,14 +550,14 @@ def ReopeningIssue(df_events, list_event_id_covered, df_all_activities):
 
         df_reopening_issue_with_comment = df_reopening_issue_with_comment[(df_reopening_issue_with_comment['time_diff'] <= UPPER_TIME_THRESHOLD) & 
                                                                         (df_reopening_issue_with_comment['time_diff'] >= LOWER_TIME_THRESHOLD)]
-        list_event_id_covered.extend(df_reopening_issue_with_comment['event_id'].to_list())
-        list_event_id_covered.extend(df_reopening_issue_with_comment['comm_event_id'].to_list())
+        event_id_covered.update(df_reopening_issue_with_comment['event_id'].to_list())
+        event_id_covered.update(df_reopening_issue_with_comment['comm_event_id'].to_list())
     
         df_reopening_issue_with_comment_proc = (
             df_reopening_issue_with_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Reopening issue')
             [general + ['issue_node_id']]
             .drop_duplicates()
@@ -749,19 +570,19 @@ def ReopeningIssue(df_events, list_event_id_covered, df_all_activities):
     '''
     df_reopening_issue_without_comment= (
         df_events
-        .query('event_type == "IssuesEvent" and action == "reopened" and event_id not in @list_event_id_covered')
+        .query('event_type == "IssuesEvent" and action == "reopened" and event_id not in @event_id_covered')
         [event_general+['issue_node_id']]
     )
 
     if(df_reopening_issue_without_comment.shape[0]>0):
 
-        list_event_id_covered.extend(df_reopening_issue_without_comment['event_id'].to_list())
+        event_id_covered.update(df_reopening_issue_without_comment['event_id'].to_list())
     
         df_reopening_issue_without_comment_proc = (
             df_reopening_issue_without_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Reopening issue')
             [general + ['issue_node_id']]
             .drop_duplicates()
@@ -769,16 +590,16 @@ def ReopeningIssue(df_events, list_event_id_covered, df_all_activities):
     
         df_all_activities = merge_issue_related(df_all_activities,df_reopening_issue_without_comment_proc)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def CommentingIssue(df_events, list_event_id_covered, df_all_activities):
+def CommentingIssue(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
     
     Commenting in issue: Filter the events based on IssueCommentEvent, where an issue_number exists in html url
     '''
@@ -788,17 +609,17 @@ def CommentingIssue(df_events, list_event_id_covered, df_all_activities):
         .sort_values(['login','repository','created_at'])
         .rename(columns={'login': 'contributor',
                          'created_at': 'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .assign(activity = "Commenting issue")
         .drop_duplicates()
         .sort_values('date')
     )
     
-    list_event_id_covered.extend(df_issue_commenting['event_id'].to_list())
+    event_id_covered.update(df_issue_commenting['event_id'].to_list())
 
     df_all_activities = merge_issue_related(df_all_activities,df_issue_commenting)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
 def merge_pr_related(df_all, df):
     '''
@@ -814,42 +635,14 @@ def merge_pr_related(df_all, df):
 
     return(df_all)
 
-def OpeningPullRequest(df_events, list_event_id_covered, df_all_activities):
+def ReopeningPullRequest(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-    
-    Opening pull request: If a PullRequestEvent with action as opened.
-    '''
-    df_opening_pullrequest = (
-        df_events
-        [event_general+['PR_node_id']]
-        .rename(columns={'login':'contributor', 'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .assign(activity='Opening pull request')
-        .assign(pr_node_id=lambda d: d.PR_node_id)
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(df_opening_pullrequest['event_id'].to_list())
-
-    df_all_activities = merge_pr_related(df_all_activities,df_opening_pullrequest)
-
-    return df_all_activities, list_event_id_covered
-
-def ReopeningPullRequest(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Reopening a pull request:
     1. Pull request is reopened with IssueCommentEvent if both the events occur within 2 seconds
@@ -932,14 +725,14 @@ def ReopeningPullRequest(df_events, list_event_id_covered, df_all_activities):
         
         df_reopening_pr_with_comment = df_reopening_pr_with_comment[(df_reopening_pr_with_comment['time_diff'] <= UPPER_TIME_THRESHOLD) & 
                                                                     (df_reopening_pr_with_comment['time_diff'] >= LOWER_TIME_THRESHOLD)]
-        list_event_id_covered.extend(df_reopening_pr_with_comment['event_id'].to_list())
-        list_event_id_covered.extend(df_reopening_pr_with_comment['comm_event_id'].to_list())
+        event_id_covered.update(df_reopening_pr_with_comment['event_id'].to_list())
+        event_id_covered.update(df_reopening_pr_with_comment['comm_event_id'].to_list())
     
         df_reopening_pr_with_comment_proc = (
             df_reopening_pr_with_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Reopening pull request')
             .assign(pr_node_id=lambda d: d.PR_node_id)
             [general + ['pr_node_id']]
@@ -955,34 +748,34 @@ def ReopeningPullRequest(df_events, list_event_id_covered, df_all_activities):
 
     df_reopening_pr_without_comment= (
         df_events
-        .query('event_type == "PullRequestEvent" and action == "reopened" and event_id not in @list_event_id_covered')
+        .query('event_type == "PullRequestEvent" and action == "reopened" and event_id not in @event_id_covered')
         [event_general+['PR_node_id']]
     )
     if(df_reopening_pr_without_comment.shape[0]>0):
         df_reopening_pr_without_comment = (
             df_reopening_pr_without_comment
             .rename(columns={'login':'contributor', 'created_at':'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Reopening pull request')
             .assign(pr_node_id=lambda d: d.PR_node_id)
             .drop_duplicates()
             .sort_values('date')
         )
 
-        list_event_id_covered.extend(df_reopening_pr_without_comment['event_id'].to_list())
+        event_id_covered.update(df_reopening_pr_without_comment['event_id'].to_list())
     
         df_all_activities = merge_pr_related(df_all_activities,df_reopening_pr_without_comment)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
+def ClosingPullRequest(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
     
     Closing PR
     1. Closing PR and merging it (cannot comment) with a push that happened within 2 seconds 
@@ -1024,12 +817,12 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
     
         pr_close_with_push = df_pr_merge_push[(df_pr_merge_push['time_diff'] <= UPPER_TIME_THRESHOLD) &
                                               (df_pr_merge_push['time_diff'] >= LOWER_TIME_THRESHOLD)]
-        list_event_id_covered.extend(pr_close_with_push['pr_event_id'].to_list())
-        list_event_id_covered.extend(pr_close_with_push['push_event_id'].to_list())
+        event_id_covered.update(pr_close_with_push['pr_event_id'].to_list())
+        event_id_covered.update(pr_close_with_push['push_event_id'].to_list())
 
         df_pr_close_with_push_proc = (
             pr_close_with_push
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Closing pull request')
             .assign(pr_node_id=lambda d: d.PR_node_id)
             .assign(comment_node_id=None)
@@ -1045,7 +838,7 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
     '''
     df_pr_close_merge_no_push= (
         df_events
-        .query('event_type == "PullRequestEvent" and action == "closed" and merged == True and event_id not in @list_event_id_covered')
+        .query('event_type == "PullRequestEvent" and action == "closed" and merged == True and event_id not in @event_id_covered')
         [event_general+['PR_node_id']]
         .rename(columns = {'event_id':'pr_event_id',
                            'login':'contributor',
@@ -1054,11 +847,11 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
 
     if(df_pr_close_merge_no_push.shape[0]>0):
 
-        list_event_id_covered.extend(df_pr_close_merge_no_push['pr_event_id'].to_list())
+        event_id_covered.update(df_pr_close_merge_no_push['pr_event_id'].to_list())
     
         df_pr_close_merge_no_push_proc = (
             df_pr_close_merge_no_push
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Closing pull request')
             .assign(pr_node_id=lambda d: d.PR_node_id)
             .assign(comment_node_id=None)
@@ -1159,14 +952,14 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
 
         if(df_closing_pr_with_comment.shape[0]>0):
 
-            list_event_id_covered.extend(df_closing_pr_with_comment['event_id'].to_list())
-            list_event_id_covered.extend(df_closing_pr_with_comment['comm_event_id'].to_list())
+            event_id_covered.update(df_closing_pr_with_comment['event_id'].to_list())
+            event_id_covered.update(df_closing_pr_with_comment['comm_event_id'].to_list())
         
             df_closing_pr_with_comment_proc = (
                 df_closing_pr_with_comment
                 .rename(columns={'login': 'contributor', 
                                 'created_at': 'date'})
-                .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+                .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
                 .assign(activity='Closing pull request')
                 .assign(pr_node_id=lambda d: d.PR_node_id)
                 .assign(comment_node_id = lambda d: d.comm_comment_node_id)
@@ -1180,13 +973,13 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
     df_pr_close_no_merge_without_comment = (
         df_events
         .query('event_type == "PullRequestEvent" and action == "closed" and merged == False and \
-                event_id not in @list_event_id_covered')
+                event_id not in @event_id_covered')
         [event_general+['PR_node_id']]
     )
 
     if(df_pr_close_no_merge_without_comment.shape[0]>0):
 
-        list_event_id_covered.extend(df_pr_close_no_merge_without_comment['event_id'].to_list())
+        event_id_covered.update(df_pr_close_no_merge_without_comment['event_id'].to_list())
     
         pr_close_without_comment = []
         pr_close_without_comment.extend(df_pr_close_no_merge_without_comment['event_id'].to_list())
@@ -1195,7 +988,7 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
             df_pr_close_no_merge_without_comment
             .rename(columns={'login': 'contributor', 
                              'created_at': 'date'})
-            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+            .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
             .assign(activity='Closing pull request')
             .assign(pr_node_id=lambda d: d.PR_node_id)
             .assign(comment_node_id=None)
@@ -1206,16 +999,16 @@ def ClosingPullRequest(df_events, list_event_id_covered, df_all_activities):
     
         df_all_activities = merge_pr_related(df_all_activities,df_pr_close_no_merge_without_comment_proc)
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def CommentingPullRequest(df_events, list_event_id_covered, df_all_activities):
+def CommentingPullRequest(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Commenting pull request: Filter the events based on IssueCommentEvent, where the PR_number field is not NA
     '''
@@ -1227,24 +1020,24 @@ def CommentingPullRequest(df_events, list_event_id_covered, df_all_activities):
         .rename(columns={'login': 'contributor',
                          'created_at': 'date',})
         .assign(activity = "Commenting pull request")
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
     )
-    list_event_id_covered.extend(df_pr_commenting['event_id'].to_list())
+    event_id_covered.update(df_pr_commenting['event_id'].to_list())
 
     df_all_activities = pd.concat([df_all_activities,df_pr_commenting.drop_duplicates()[general]])
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def CommentingPullRequestChanges(df_events, list_event_id_covered, df_all_activities):
+def CommentingPullRequestChanges(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Commenting pull request changes: Filter the events based on PullRequestReviewCommentEvent and 
                                      PullRequestReviewEvent with review_state as "commented"
@@ -1264,12 +1057,12 @@ def CommentingPullRequestChanges(df_events, list_event_id_covered, df_all_activi
         .rename(columns={'login':'contributor', 
                          'created_at':'date'})
         .assign(activity = "Commenting pull request changes")
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
         )
 
-    list_event_id_covered.extend(df_pr_review_commenting['event_id'].to_list())
+    event_id_covered.update(df_pr_review_commenting['event_id'].to_list())
     if(len(df_pr_review_commenting.query('event_type == "PullRequestReviewCommentEvent"')) > 0):
         df_pr_review_commenting = df_pr_review_commenting.query('event_type == "PullRequestReviewCommentEvent"') #The PullRequestReviewEvent with review_state as commented 
                     #will have an associated PullRequestReviewCommentEvent for comment, so have to capture that as an activity and not the PullRequestReviewEvent as such.
@@ -1277,16 +1070,16 @@ def CommentingPullRequestChanges(df_events, list_event_id_covered, df_all_activi
 
     df_all_activities = pd.concat([df_all_activities,df_pr_review_commenting.drop_duplicates()[general]])
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def ReviewingCode(df_events, list_event_id_covered, df_all_activities):
+def ReviewingCode(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Reviewing code: Filter the events based on PullRequestReviewEvent with review_state as 
                     "approved"/"dismissed"/"changes_requested"
@@ -1298,56 +1091,27 @@ def ReviewingCode(df_events, list_event_id_covered, df_all_activities):
         .assign(activity = "Reviewing code")
         .rename(columns={'login':'contributor',
                          'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .drop_duplicates()
         .sort_values('date')
     )
 
-    list_event_id_covered.extend(df_pr_review_code['event_id'].to_list())
+    event_id_covered.update(df_pr_review_code['event_id'].to_list())
 
     df_pr_review_code = df_pr_review_code.drop(['event_id'],axis=1).drop_duplicates()
 
     df_all_activities = pd.concat([df_all_activities,df_pr_review_code.drop_duplicates()[general]])
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
-def CommentingCommits(df_events, list_event_id_covered, df_all_activities):
+def PushingCommits(df_events, event_id_covered, df_all_activities):
     '''
     args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
+          event_id_covered (set) - event id's that are covered in previous iterations
           df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
     
     returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
-
-    Commenting commits: Filter the events based on CommitCommentEvent
-    '''
-
-    df_commit_commenting = (
-        df_events
-        [event_general+['comment_node_id']]
-        .assign(activity = "Commenting commit")
-        .rename(columns={'login':'contributor',
-                         'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
-        .drop_duplicates()
-        .sort_values('date')
-    )
-
-    list_event_id_covered.extend(df_commit_commenting['event_id'].to_list())
-
-    df_all_activities = pd.concat([df_all_activities, df_commit_commenting.drop_duplicates()[general]])
-
-    return df_all_activities, list_event_id_covered
-
-def PushingCommits(df_events, list_event_id_covered, df_all_activities):
-    '''
-    args: df_events (DataFrame) - events
-          list_event_id_covered (list) - a list of event id's that are covered in previous iterations
-          df_all_activities (DataFrame) - DataFrame of all the previously identified activities for a contributor
-    
-    returns: df_all_activities (DataFrame) - Updated DataFrame of all activities that are identified for the contributor
-             list_event_id_covered - Updated list of event id's that are covered in previous iterations
+             event_id_covered - Updated set of event id's that are covered in previous iterations
 
     Pushing commits: Filter the events based on PushEvent, remove the events that are already covered in pull request close event
     '''
@@ -1357,23 +1121,23 @@ def PushingCommits(df_events, list_event_id_covered, df_all_activities):
         .assign(activity = "Pushing commits")
         .rename(columns={'login':'contributor', 
                          'created_at':'date'})
-        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC').map(lambda x: x.isoformat()))
+        .assign(date=lambda d: d.date.dt.tz_localize(tz='UTC'))
         .assign(GH_push_id=lambda d: d.push_id.astype('int64'))
         .drop_duplicates()
         .sort_values('date')
     )
 
-    list_event_id_covered.extend(pushing_commits['event_id'].to_list())
+    event_id_covered.update(pushing_commits['event_id'].to_list())
 
     df_all_activities = pd.concat([df_all_activities, pushing_commits.drop_duplicates()[general]])
 
-    return df_all_activities, list_event_id_covered
+    return df_all_activities, event_id_covered
 
 def activity_identification(df_events):
     '''
     args: df_events (DataFrame) - A DataFrame of contributor events
     
-    returns: df_all_activities (DataFrame) - A DataFrame of contributor activities
+    returns: df_all_activities (DataFrame) - A DataFrame of contributor activities, with the date of the activities in UTC (datetime64)
     
     method:
     Get the events from DataFrame, identify the activities, and return it in DataFrame.
@@ -1391,65 +1155,32 @@ def activity_identification(df_events):
     df_events['created_at'] = pd.to_datetime(df_events.created_at, errors='coerce', format='%Y-%m-%dT%H:%M:%SZ').dt.tz_localize(None)
     
     df_events = df_events.astype({'event_id':'Int64'})
-    df_events = df_events.sort_values('created_at')
+    # event_id breaks ties between events of the same second, so that the identified activities only depend on the set of events
+    df_events = df_events.sort_values(['created_at','event_id'])
 
     '''
-    list_event_id_covered - event_ids that are already processed
+    event_id_covered - set of the event_ids that are already processed, for constant time membership tests
     df_all_activities - DataFrame for all activities
     Invoke only the required activity functions based on events
     '''
-    list_event_id_covered = []
+    event_id_covered = set()
     df_all_activities = pd.DataFrame()
-    if(df_events.columns.isin(['ref_type']).any()):
-        temp_df = df_events.query('event_type == "CreateEvent" and ref_type == "repository"')
-        if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CreatingRepository(temp_df, list_event_id_covered, df_all_activities)
+    df_all_activities, event_id_covered = SimpleActivities(df_events, event_id_covered, df_all_activities)
 
-        temp_df = df_events.query('event_type == "CreateEvent" and ref_type == "branch"')
-        if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CreateBranch(temp_df, list_event_id_covered, df_all_activities)
-        
+    if(df_events.columns.isin(['ref_type']).any()):
         if(df_events.columns.isin(['release_node_id']).any()):
             temp_df = df_events.query('event_type == "ReleaseEvent" or (event_type == "CreateEvent" and ref_type == "tag")')
             if(temp_df.shape[0]>0):
-                df_all_activities, list_event_id_covered = PublishingRelease(temp_df, list_event_id_covered, df_all_activities)
+                df_all_activities, event_id_covered = PublishingRelease(temp_df, event_id_covered, df_all_activities)
     if(df_events.columns.isin(['release_node_id']).any() and ~df_events.columns.isin(['ref_type']).any()):
         temp_df = df_events.query('event_type == "ReleaseEvent"')
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = PublishingRelease(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = PublishingRelease(temp_df, event_id_covered, df_all_activities)
     
     if(df_events.columns.isin(['ref_type']).any()):
-        temp_df = df_events.query('event_type == "CreateEvent" and ref_type == "tag" and event_id not in @list_event_id_covered')
+        temp_df = df_events.query('event_type == "CreateEvent" and ref_type == "tag" and event_id not in @event_id_covered')
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CreatingTag(temp_df, list_event_id_covered, df_all_activities)
-        
-        temp_df = df_events.query('event_type == "DeleteEvent" and ref_type == "tag"')
-        if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = DeletingTag(temp_df, list_event_id_covered, df_all_activities)
-        
-        temp_df = df_events.query('event_type == "DeleteEvent" and ref_type == "branch"')
-        if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = DeletingBranch(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "PublicEvent"')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = MakingRepositoryPublic(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "MemberEvent"')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = AddingCollaborator(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "ForkEvent"')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = ForkingRepository(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "WatchEvent"')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = StarringRepository(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "GollumEvent"')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = EditingWikiPage(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = CreatingTag(temp_df, event_id_covered, df_all_activities)
     
     if(df_events.columns.isin(['action']).any()):
         if(df_events.columns.isin(['num_comments']).any() and df_events.columns.isin(['issue_closed_at']).any()):
@@ -1458,69 +1189,64 @@ def activity_identification(df_events):
                                  ((df_events['num_comments']>0) | (df_events['issue_closed_at'].notnull()))]
                       )
             if(temp_df.shape[0]>0):
-                df_all_activities, list_event_id_covered = TransferingIssue(temp_df, list_event_id_covered, df_all_activities)
-        temp_df = df_events.query('event_type == "IssuesEvent" and action == "opened" and event_id not in @list_event_id_covered')
+                df_all_activities, event_id_covered = TransferingIssue(temp_df, event_id_covered, df_all_activities)
+        temp_df = df_events.query('event_type == "IssuesEvent" and action == "opened" and event_id not in @event_id_covered')
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = OpeningIssue(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = OpeningIssue(temp_df, event_id_covered, df_all_activities)
     
         temp_df = df_events.query('(event_type == "IssuesEvent" and action == "closed") or event_type == "IssueCommentEvent"')
         temp_df = temp_df.dropna(axis=1, how='all')
         if(temp_df.shape[0]>0 and temp_df.columns.isin(['issue_node_id']).any() and temp_df.columns.isin(['issue_closed_at']).any()):
-            df_all_activities, list_event_id_covered = ClosingIssue(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = ClosingIssue(temp_df, event_id_covered, df_all_activities)
     
         temp_df = df_events.query('((event_type == "IssuesEvent" and action == "reopened") or event_type == "IssueCommentEvent") \
-        and event_id not in @list_event_id_covered')
+        and event_id not in @event_id_covered')
         temp_df = temp_df.dropna(axis=1, how='all')
         if(temp_df.shape[0]>0 and temp_df.columns.isin(['issue_node_id']).any()):
-            df_all_activities, list_event_id_covered = ReopeningIssue(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = ReopeningIssue(temp_df, event_id_covered, df_all_activities)
     
-    temp_df = df_events.query('event_type == "IssueCommentEvent" and event_id not in @list_event_id_covered ')
+    temp_df = df_events.query('event_type == "IssueCommentEvent" and event_id not in @event_id_covered ')
     temp_df = temp_df.dropna(axis=1, how='all')
     if(temp_df.columns.isin(['issue_number']).any()):
         temp_df = temp_df[temp_df['issue_number'].notnull()]
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CommentingIssue(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = CommentingIssue(temp_df, event_id_covered, df_all_activities)
 
     if(df_events.columns.isin(['action']).any()):
-        temp_df = df_events.query('event_type == "PullRequestEvent" and action == "opened"')
-        if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = OpeningPullRequest(temp_df, list_event_id_covered, df_all_activities)
-    
         temp_df = df_events.query('((event_type == "PullRequestEvent" and action == "reopened") or event_type == "IssueCommentEvent") \
-        and event_id not in @list_event_id_covered')
+        and event_id not in @event_id_covered')
         temp_df = temp_df.dropna(axis=1, how='all')
         if(temp_df.shape[0]>0 and temp_df.columns.isin(['PR_node_id']).any()):
-            df_all_activities, list_event_id_covered = ReopeningPullRequest(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = ReopeningPullRequest(temp_df, event_id_covered, df_all_activities)
     
         temp_df = df_events.query('((event_type == "PullRequestEvent" and action == "closed") or \
-        event_type == "PushEvent" or event_type == "IssueCommentEvent") and event_id not in @list_event_id_covered')
+        event_type == "PushEvent" or event_type == "IssueCommentEvent") and event_id not in @event_id_covered')
         temp_df = temp_df.dropna(axis=1, how='all')
         if(temp_df.shape[0]>0 and temp_df.columns.isin(['PR_node_id']).any() and temp_df.columns.isin(['merged']).any()):
-            df_all_activities, list_event_id_covered = ClosingPullRequest(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = ClosingPullRequest(temp_df, event_id_covered, df_all_activities)
     
     if(df_events.columns.isin(['PR_number']).any()):
         temp_df = (df_events[(df_events['event_type'] == 'IssueCommentEvent') &
                              (df_events['PR_number'].notnull()) &  
-                             (~df_events['event_id'].isin(list_event_id_covered))])
+                             (~df_events['event_id'].isin(event_id_covered))])
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CommentingPullRequest(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = CommentingPullRequest(temp_df, event_id_covered, df_all_activities)
 
     if(df_events.columns.isin(['review_state']).any()):
         temp_df = df_events.query('(event_type == "PullRequestReviewCommentEvent") or \
         (event_type == "PullRequestReviewEvent" and review_state == "commented")')
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = CommentingPullRequestChanges(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = CommentingPullRequestChanges(temp_df, event_id_covered, df_all_activities)
     
         temp_df = df_events.query('event_type == "PullRequestReviewEvent" and review_state != "commented"')
         if(temp_df.shape[0]>0):
-            df_all_activities, list_event_id_covered = ReviewingCode(temp_df, list_event_id_covered, df_all_activities)
+            df_all_activities, event_id_covered = ReviewingCode(temp_df, event_id_covered, df_all_activities)
     
-    temp_df = df_events.query('event_type == "CommitCommentEvent"')
+    temp_df = df_events.query('event_type == "PushEvent" and event_id not in @event_id_covered')
     if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = CommentingCommits(temp_df, list_event_id_covered, df_all_activities)
-    
-    temp_df = df_events.query('event_type == "PushEvent" and event_id not in @list_event_id_covered')
-    if(temp_df.shape[0]>0):
-        df_all_activities, list_event_id_covered = PushingCommits(temp_df, list_event_id_covered, df_all_activities)
+        df_all_activities, event_id_covered = PushingCommits(temp_df, event_id_covered, df_all_activities)
+
+    if(df_all_activities.shape[0]>0):
+        df_all_activities = df_all_activities.iloc[df_all_activities['activity'].map(ACTIVITY_ORDER).argsort(kind='stable')]
 
-    return(df_all_activities)
\ No newline at end of file
+    return(df_all_activities)
@@ -0,0 +1,185 @@
+import os
+import json
+import gzip
+import time
+import hashlib
+import tempfile
+import threading
+import requests
+
+CACHE_MAX_SIZE = 500 # MB
+CACHE_MAX_AGE = 30 # days
+CACHE_FILE_SUFFIX = '.json.gz'
+KEPT_HEADERS = ['Content-Type', 'ETag', 'Last-Modified', 'Link']
+
+class ResponseCache:
+    '''
+    description: On-disk cache of the responses of the GitHub API. A cached response is revalidated with a conditional
+                 request (If-None-Match/If-Modified-Since). GitHub answers with 304 Not Modified if the response did not
+                 change, the response is then read from disk and the query does not count against the rate limit.
+                 Responses are cached per URL and per API key, as the responses may depend on the permissions of the key.
+                 The least recently used responses are evicted when the cache exceeds max_size, and the responses that
+                 were not used for more than max_age are not revalidated anymore.
+    '''
+
+    def __init__(self, cache_dir, max_size=CACHE_MAX_SIZE, max_age=CACHE_MAX_AGE):
+        '''
+        args: cache_dir (str) - directory in which the responses are stored, created if needed
+              max_size (float) - maximum size of the cache, in MB
+              max_age (float) - maximum number of days since a response was last used
+        '''
+
+        self.cache_dir = cache_dir
+        self.max_size = max_size*1024*1024
+        self.max_age = max_age*24*3600
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in os.scandir(cache_dir) if entry.name.endswith(CACHE_FILE_SUFFIX))
+        if self._size > self.max_size:
+            self.evict()
+
+    def entry_path(self, key, url):
+        '''
+        args: key (str) - the API key, None for unauthenticated queries
+              url (str) - the queried URL
+
+        returns: path (str) - path of the file in which the response is stored
+
+        description: The file name is a hash of the API key and the URL, the API key itself is never written to disk.
+        '''
+
+        token_identity = hashlib.sha256((key or '').encode()).hexdigest()
+        name = hashlib.sha256(f'{token_identity} {url}'.encode()).hexdigest()
+
+        return(os.path.join(self.cache_dir, name + CACHE_FILE_SUFFIX))
+
+    def load(self, path):
+        '''
+        args: path (str) - path of the cached response
+
+        returns: entry (dict) - the cached response (url, status_code, headers and content), None if it is not cached or expired
+        '''
+
+        try:
+            if time.time() - os.stat(path).st_mtime > self.max_age:
+                self.remove(path)
+                return(None)
+            with gzip.open(path, 'rt', encoding='utf-8') as cache_file:
+                return(json.load(cache_file))
+        except (OSError, ValueError):
+            return(None)
+
+    def store(self, path, response):
+        '''
+        args: path (str) - path of the cached response
+              response (requests.Response) - successful response to cache
+
+        returns: None
+
+        description: Write the response to a temporary file that then replaces the cached response, so that a response
+                     being read by another thread is never half written. Evict responses if the cache is too large.
+        '''
+
+        entry = {'url': response.url,
+                 'status_code': response.status_code,
+                 'headers': {header: response.headers[header] for header in KEPT_HEADERS if header in response.headers},
+                 'content': response.content.decode('utf-8')}
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(file_descriptor, 'wb') as temp_file:
+            with gzip.GzipFile(fileobj=temp_file, mode='wb') as cache_file:
+                cache_file.write(json.dumps(entry).encode('utf-8'))
+        with self._lock:
+            self._size = self._size - self.file_size(path) + os.stat(temp_path).st_size
+            os.replace(temp_path, path)
+            if self._size > self.max_size:
+                self.evict()
+
+    def remove(self, path):
+        '''
+        args: path (str) - path of the cached response
+
+        returns: None
+        '''
+
+        with self._lock:
+            size = self.file_size(path)
+            try:
+                os.remove(path)
+                self._size = self._size - size
+            except OSError:
+                pass
+
+    def evict(self):
+        '''
+        args: None
+
+        returns: None
+
+        description: Remove the least recently used responses until the cache is below 90% of its maximum size,
+                     so that eviction does not happen again with the next stored response. Called with the lock held.
+        '''
+
+        entries = sorted((entry for entry in os.scandir(self.cache_dir) if entry.name.endswith(CACHE_FILE_SUFFIX)),
+                         key=lambda entry: entry.stat().st_mtime)
+        for entry in entries:
+            if self._size <= 0.9*self.max_size:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._size = self._size - size
+            except OSError:
+                pass
+
+    @staticmethod
+    def file_size(path):
+        '''
+        args: path (str) - path of a file
+
+        returns: size (int) - size of the file in bytes, 0 if it does not exist
+        '''
+
+        try:
+            return(os.stat(path).st_size)
+        except OSError:
+            return(0)
+
+    def get(self, session, key, url):
+        '''
+        args: session (requests.Session) - HTTP session to query the GitHub API
+              key (str) - the API key the session is authenticated with, None for unauthenticated queries
+              url (str) - the URL to query
+
+        returns: response (requests.Response) - the response of the GitHub API, or the cached response if it did not change
+
+        description: Query the URL, conditionally if the response is cached. On 304 Not Modified, the cached response is
+                     returned with the headers of the 304 response (e.g., the remaining rate limit). Successful responses
+                     with an ETag or a Last-Modified header are cached.
+        '''
+
+        path = self.entry_path(key, url)
+        entry = self.load(path)
+        headers = {}
+        if entry is not None:
+            if 'ETag' in entry['headers']:
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if 'Last-Modified' in entry['headers']:
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+
+        response = session.get(url, headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            cached_response = requests.models.Response()
+            cached_response.status_code = entry['status_code']
+            cached_response.url = entry['url']
+            cached_response.encoding = 'utf-8'
+            cached_response._content = entry['content'].encode('utf-8')
+            cached_response.headers.update(entry['headers'])
+            cached_response.headers.update({header: value for header, value in response.headers.items() if header.startswith('X-RateLimit')})
+            os.utime(path) # least recently used eviction
+            return(cached_response)
+
+        if response.ok and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+            self.store(path, response)
+
+        return(response)
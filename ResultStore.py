@@ -0,0 +1,82 @@
+import json
+import time
+import sqlite3
+import threading
+
+RESULT_TTL = 7 # days
+
+class ResultStore:
+    '''
+    description: SQLite store of the results of the contributors whose type was determined through their events.
+                 A result is fully determined by the events of the contributor, the model and the settings (minimum
+                 number of events, minimum confidence and maximum number of queries). As long as the newest event of
+                 the contributor did not change, the stored result is reused instead of identifying the activities
+                 and running the model again. The events older than 90 days are not reported by the GitHub Events API
+                 anymore, the results are therefore only reused for ttl days.
+    '''
+
+    def __init__(self, store_path, ttl=RESULT_TTL, refresh=False):
+        '''
+        args: store_path (str) - path of the SQLite database, created if needed
+              ttl (float) - number of days during which a stored result is reused
+              refresh (bool) - If True, the stored results are never reused, only replaced by the new results
+        '''
+
+        self.store_path = store_path
+        self.ttl = ttl*24*3600
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(store_path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS results (login TEXT PRIMARY KEY, newest_event TEXT, model_version TEXT, \
+settings TEXT, stored_at REAL, result TEXT)')
+
+    def lookup(self, login, newest_event, model_version, settings):
+        '''
+        args: login (str) - login name of the contributor
+              newest_event (str) - id of the newest event of the contributor
+              model_version (str) - hash of the model
+              settings (str) - settings with which the result was determined
+
+        returns: result (dict) - the stored result (type, confidence and features), None if there is no valid stored result
+        '''
+
+        if self.refresh:
+            return(None)
+        with self._lock:
+            row = self._connection.execute('SELECT newest_event, model_version, settings, stored_at, result FROM results WHERE login = ?',
+                                           (login,)).fetchone()
+        if row is None:
+            return(None)
+        stored_newest_event, stored_model_version, stored_settings, stored_at, result = row
+        if(stored_newest_event != str(newest_event) or stored_model_version != model_version or stored_settings != settings
+           or time.time() - stored_at > self.ttl):
+            return(None)
+
+        return(json.loads(result))
+
+    def store(self, login, newest_event, model_version, settings, result):
+        '''
+        args: login (str) - login name of the contributor
+              newest_event (str) - id of the newest event of the contributor
+              model_version (str) - hash of the model
+              settings (str) - settings with which the result was determined
+              result (dict) - the result (type, confidence and features) to store
+
+        returns: None
+        '''
+
+        result = json.dumps(result, default=lambda value: value.item()) # numpy scalars
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)',
+                                     (login, str(newest_event), model_version, settings, time.time(), result))
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,90 @@
+import os
+import time
+
+PART_FILE_SUFFIX = '.part'
+
+class ResultWriter:
+    '''
+    description: Append-only writer of the results for --incremental. The new results are appended to FILE.part
+                 instead of writing again all the results, so that the time spent writing grows linearly with the
+                 number of contributors. The results are written at most every flush_interval seconds, and the
+                 complete file is atomically renamed to FILE when all the results are written. The written file is
+                 the same as the one written at once by save_results.
+                 csv - one line per result
+                 jsonl - one JSON record per line, each line is a complete record
+                 json - the records of a JSON array, the array is closed when all the results are written
+    '''
+
+    def __init__(self, output_type, save_path, flush_interval=0):
+        '''
+        args: output_type (str) - csv, jsonl or json
+              save_path (str) - the path along with file name and extension to save the results
+              flush_interval (float) - minimum time (in seconds) between two writes to the file
+        '''
+
+        self.output_type = output_type
+        self.save_path = save_path
+        self.flush_interval = flush_interval
+        self._part_path = save_path + PART_FILE_SUFFIX
+        self._file = open(self._part_path, 'w', encoding='utf-8')
+        self._pending = []
+        self._written = 0 # number of results written to the file
+        self._last_flush = time.time()
+        if output_type == 'json':
+            self._file.write('[\n')
+
+    def write(self, results):
+        '''
+        args: results (DataFrame) - new results to append
+
+        returns: None
+        '''
+
+        self._pending.append(results)
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        '''
+        args: None
+
+        returns: None
+
+        description: Append the pending results to the file, with the same format as save_results
+        '''
+
+        for results in self._pending:
+            results = results.reset_index(names=['contributor'])
+            if len(results) == 0:
+                continue
+            if self.output_type == 'csv':
+                results.index = range(self._written, self._written + len(results))
+                results.to_csv(self._file, header=self._written == 0)
+            elif self.output_type == 'jsonl':
+                self._file.write(results.to_json(orient='records', lines=True))
+            elif self.output_type == 'json':
+                records = results.to_json(orient='records', indent=4)[2:-2] # without the brackets of the array
+                if self._written > 0:
+                    self._file.write(',\n')
+                self._file.write(records)
+            self._written = self._written + len(results)
+        self._pending = []
+        self._file.flush()
+        self._last_flush = time.time()
+
+    def close(self, complete=True):
+        '''
+        args: complete (bool) - If True, all the results were written and FILE.part is renamed to FILE.
+                                Otherwise, FILE.part is left with the results written so far.
+
+        returns: None
+        '''
+
+        self.flush()
+        if self.output_type == 'json' and complete:
+            self._file.write('\n]')
+        elif self.output_type == 'csv' and complete and self._written == 0:
+            self._file.write(',contributor\n') # header of an empty result, as written by save_results
+        self._file.close()
+        if complete:
+            os.replace(self._part_path, self.save_path)
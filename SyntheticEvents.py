@@ -0,0 +1,274 @@
+import random
+from datetime import datetime, timedelta
+
+'''
+Relative frequency of the scenarios generated by generate_events. Each scenario produces the events that GitHub reports
+for one action of a contributor, e.g., closing an issue with a comment produces an IssueCommentEvent and an IssuesEvent
+in the same second, so that all the rules of GenerateActivities are exercised.
+'''
+SCENARIO_MIX = {'push': 30,
+                'open_pull_request': 6,
+                'close_pull_request': 6,
+                'reopen_pull_request': 1,
+                'comment_pull_request': 5,
+                'review_pull_request': 6,
+                'review_comment': 5,
+                'open_issue': 5,
+                'close_issue': 5,
+                'reopen_issue': 1,
+                'transfer_issue': 1,
+                'comment_issue': 8,
+                'create_branch': 4,
+                'delete_branch': 3,
+                'create_tag': 2,
+                'delete_tag': 1,
+                'create_repository': 1,
+                'publish_release': 2,
+                'commit_comment': 1,
+                'watch': 4,
+                'fork': 1,
+                'gollum': 1,
+                'public': 1,
+                'member': 1}
+PAUSES = [1, 2, 5, 30, 60, 300, 600, 3600, 4*3600, 86400] # seconds between two scenarios
+START_TIME = datetime(2024, 1, 1)
+FIRST_EVENT_ID = 30000000000
+
+class EventGenerator:
+    '''
+    description: Generator of synthetic events of a contributor, in the format of the GitHub Events API (only the fields
+                 read by ExtractEvent are filled). The events are generated from the oldest to the most recent, with
+                 increasing ids, over a few repositories of the contributor and of other owners.
+    '''
+
+    def __init__(self, login, seed=0, start=START_TIME):
+        '''
+        args: login (str) - login name of the contributor
+              seed (int) - seed of the random generator, the same seed generates the same events
+              start (datetime) - time of the first event
+        '''
+
+        self.login = login
+        self.random = random.Random(seed)
+        self.time = start
+        self.event_id = FIRST_EVENT_ID + seed*10**7
+        self.repositories = [f'{owner}/{name}' for owner in (login, 'octo-org', 'other-owner') for name in ('core', 'docs', 'tools')]
+        self.numbers = {} # last issue or pull request number of each repository
+        self.events = []
+
+    def event(self, event_type, repository, payload, delay=0):
+        '''
+        args: event_type (str) - type of the event (e.g., PushEvent)
+              repository (str) - full name of the repository
+              payload (dict) - payload of the event
+              delay (int) - seconds elapsed since the previous event
+
+        returns: None
+        '''
+
+        self.time = self.time + timedelta(seconds=delay)
+        self.event_id = self.event_id + 1
+        self.events.append({'id': str(self.event_id),
+                            'type': event_type,
+                            'actor': {'login': self.login},
+                            'repo': {'name': repository},
+                            'created_at': self.time.strftime('%Y-%m-%dT%H:%M:%SZ'),
+                            'payload': payload})
+
+    def node_id(self, prefix):
+        '''
+        args: prefix (str) - prefix of the node id (e.g., I for issues, PR for pull requests)
+
+        returns: node_id (str) - a new node id
+        '''
+
+        return(f'{prefix}_{self.event_id+1}')
+
+    def new_number(self, repository):
+        '''
+        args: repository (str) - full name of the repository
+
+        returns: number (int) - number of a new issue or pull request of the repository
+        '''
+
+        self.numbers[repository] = self.numbers.get(repository, 0) + 1
+
+        return(self.numbers[repository])
+
+    def issue(self, repository, kind='issues', state='open', comments=0, closed=False):
+        '''
+        args: repository (str) - full name of the repository
+              kind (str) - issues or pull, the issues of pull requests are reported with /pull/ in their html_url
+              state (str) - state of the issue
+              comments (int) - number of comments of the issue
+              closed (bool) - If True, the issue has a closing time
+
+        returns: issue (dict) - issue object of the payload
+        '''
+
+        number = self.new_number(repository)
+
+        return({'number': number,
+                'node_id': f'I_{repository}#{number}',
+                'html_url': f'https://github.com/{repository}/{kind}/{number}',
+                'state': state,
+                'comments': comments,
+                'closed_at': self.time.strftime('%Y-%m-%dT%H:%M:%SZ') if closed else None})
+
+    def pull_request(self, repository, state='open', merged=False):
+        '''
+        args: repository (str) - full name of the repository
+              state (str) - state of the pull request
+              merged (bool) - If True, the pull request is merged
+
+        returns: pull_request (dict) - pull_request object of the payload
+        '''
+
+        number = self.new_number(repository)
+
+        return({'number': number, 'node_id': f'PR_{repository}#{number}', 'state': state, 'merged': merged})
+
+    def scenario(self, name, repository):
+        '''
+        args: name (str) - name of the scenario, see SCENARIO_MIX
+              repository (str) - full name of the repository
+
+        returns: None
+        '''
+
+        rnd = self.random
+        if(name == 'push'):
+            for _ in range(rnd.choice([1, 1, 1, 2, 3])):
+                self.event('PushEvent', repository, {'push_id': rnd.randint(10**9, 10**10)}, rnd.choice([0, 1, 4]))
+        elif(name == 'open_pull_request'):
+            self.event('CreateEvent', repository, {'ref': f'feature-{self.event_id}', 'ref_type': 'branch'})
+            self.event('PushEvent', repository, {'push_id': rnd.randint(10**9, 10**10)}, 1)
+            self.event('PullRequestEvent', repository, {'action': 'opened', 'pull_request': self.pull_request(repository)}, rnd.choice([1, 60]))
+        elif(name == 'close_pull_request'):
+            merged = rnd.random() < 0.7
+            pull_request = self.pull_request(repository, 'closed', merged)
+            if(rnd.random() < 0.4):
+                issue = self.issue(repository, 'pull', 'closed', 1, True)
+                issue.update(number=pull_request['number'], node_id=pull_request['node_id'])
+                self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': issue, 'comment': {'node_id': self.node_id('IC')}})
+            if(merged and rnd.random() < 0.5):
+                self.event('PushEvent', repository, {'push_id': rnd.randint(10**9, 10**10)}, 1)
+            self.event('PullRequestEvent', repository, {'action': 'closed', 'pull_request': pull_request}, rnd.choice([0, 1]))
+            if(rnd.random() < 0.5):
+                self.event('DeleteEvent', repository, {'ref': f'feature-{self.event_id}', 'ref_type': 'branch'}, 1)
+        elif(name == 'reopen_pull_request'):
+            pull_request = self.pull_request(repository)
+            if(rnd.random() < 0.5):
+                issue = self.issue(repository, 'pull', 'open', 1)
+                issue.update(number=pull_request['number'], node_id=pull_request['node_id'])
+                self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': issue, 'comment': {'node_id': self.node_id('IC')}})
+            self.event('PullRequestEvent', repository, {'action': 'reopened', 'pull_request': pull_request}, rnd.choice([0, 1]))
+        elif(name == 'comment_pull_request'):
+            self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': self.issue(repository, 'pull', 'open', rnd.randint(1, 5)),
+                                                         'comment': {'node_id': self.node_id('IC')}})
+        elif(name == 'review_pull_request'):
+            pull_request = self.pull_request(repository)
+            review_state = rnd.choice(['approved', 'changes_requested', 'commented'])
+            if(review_state == 'commented' or rnd.random() < 0.3):
+                self.event('PullRequestReviewCommentEvent', repository, {'action': 'created', 'pull_request': pull_request,
+                                                                         'comment': {'node_id': self.node_id('RC')}})
+            self.event('PullRequestReviewEvent', repository, {'action': 'created', 'pull_request': pull_request,
+                                                              'review': {'state': review_state, 'node_id': self.node_id('PRR')}}, rnd.choice([0, 1]))
+        elif(name == 'review_comment'):
+            pull_request = self.pull_request(repository)
+            for _ in range(rnd.randint(1, 4)):
+                self.event('PullRequestReviewCommentEvent', repository, {'action': 'created', 'pull_request': pull_request,
+                                                                         'comment': {'node_id': self.node_id('RC')}}, rnd.choice([0, 1, 30]))
+        elif(name == 'open_issue'):
+            self.event('IssuesEvent', repository, {'action': 'opened', 'issue': self.issue(repository)})
+        elif(name == 'close_issue'):
+            issue = self.issue(repository, 'issues', 'closed', rnd.randint(0, 3), True)
+            if(rnd.random() < 0.5):
+                self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': issue, 'comment': {'node_id': self.node_id('IC')}})
+            self.event('IssuesEvent', repository, {'action': 'closed', 'issue': issue}, rnd.choice([0, 1]))
+        elif(name == 'reopen_issue'):
+            issue = self.issue(repository, 'issues', 'open', 1)
+            if(rnd.random() < 0.5):
+                self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': issue, 'comment': {'node_id': self.node_id('IC')}})
+            self.event('IssuesEvent', repository, {'action': 'reopened', 'issue': issue}, rnd.choice([0, 1]))
+        elif(name == 'transfer_issue'):
+            # an issue transferred from another repository is reported as opened, with comments or already closed
+            self.event('IssuesEvent', repository, {'action': 'opened', 'issue': self.issue(repository, 'issues', 'open', rnd.randint(1, 5))})
+        elif(name == 'comment_issue'):
+            self.event('IssueCommentEvent', repository, {'action': 'created', 'issue': self.issue(repository, 'issues', 'open', rnd.randint(1, 5)),
+                                                         'comment': {'node_id': self.node_id('IC')}})
+        elif(name == 'create_branch' or name == 'delete_branch'):
+            event_type = 'CreateEvent' if name == 'create_branch' else 'DeleteEvent'
+            self.event(event_type, repository, {'ref': f'branch-{self.event_id}', 'ref_type': 'branch'})
+        elif(name == 'create_tag' or name == 'delete_tag'):
+            event_type = 'CreateEvent' if name == 'create_tag' else 'DeleteEvent'
+            self.event(event_type, repository, {'ref': f'v{self.event_id}', 'ref_type': 'tag'})
+        elif(name == 'create_repository'):
+            self.event('CreateEvent', repository, {'ref': None, 'ref_type': 'repository'})
+        elif(name == 'publish_release'):
+            tag_name = f'v{self.event_id}'
+            if(rnd.random() < 0.7):
+                self.event('CreateEvent', repository, {'ref': tag_name, 'ref_type': 'tag'})
+            self.event('ReleaseEvent', repository, {'action': 'published', 'release': {'tag_name': tag_name, 'node_id': self.node_id('RE')}},
+                       rnd.choice([0, 1]))
+        elif(name == 'commit_comment'):
+            self.event('CommitCommentEvent', repository, {'comment': {'node_id': self.node_id('CC')}})
+        elif(name == 'watch'):
+            self.event('WatchEvent', repository, {'action': 'started'})
+        elif(name == 'fork'):
+            self.event('ForkEvent', repository, {'forkee': {'full_name': f'{self.login}/{repository.split("/")[1]}'}})
+        elif(name == 'gollum'):
+            self.event('GollumEvent', repository, {'pages': [{'action': 'edited'}]})
+        elif(name == 'public'):
+            self.event('PublicEvent', repository, {})
+        elif(name == 'member'):
+            self.event('MemberEvent', repository, {'action': 'added'})
+
+    def push_burst(self, size):
+        '''
+        args: size (int) - number of PushEvents of the burst
+
+        returns: None
+
+        description: Adversarial case of many PushEvents within the 2 seconds window in which GenerateActivities pairs events
+                     (e.g., a bot pushing to hundreds of branches at once), all in the same repository and second.
+        '''
+
+        repository = self.random.choice(self.repositories)
+        for position in range(size):
+            self.event('PushEvent', repository, {'push_id': self.random.randint(10**9, 10**10)}, 1 if position == 0 else 0)
+
+    def generate(self, num_events, push_bursts=0, burst_size=300):
+        '''
+        args: num_events (int) - number of events to generate
+              push_bursts (int) - number of bursts of PushEvents among the events (see push_burst)
+              burst_size (int) - number of PushEvents of each burst
+
+        returns: events (list) - the num_events generated events, from the most recent to the oldest as the GitHub Events API reports them
+        '''
+
+        names = list(SCENARIO_MIX)
+        weights = [SCENARIO_MIX[name] for name in names]
+        bursts = sorted(self.random.sample(range(num_events), min(push_bursts, num_events)))
+        while(len(self.events) < num_events):
+            if(len(bursts) > 0 and len(self.events) >= bursts[0]):
+                bursts.pop(0)
+                self.push_burst(burst_size)
+                continue
+            self.time = self.time + timedelta(seconds=self.random.choice(PAUSES))
+            self.scenario(self.random.choices(names, weights)[0], self.random.choice(self.repositories))
+
+        return(self.events[:num_events][::-1])
+
+def generate_events(login, num_events, seed=0, push_bursts=0, burst_size=300):
+    '''
+    args: login (str) - login name of the contributor
+          num_events (int) - number of events to generate
+          seed (int) - seed of the random generator, the same seed generates the same events
+          push_bursts (int) - number of bursts of PushEvents within 2 seconds among the events
+          burst_size (int) - number of PushEvents of each burst
+
+    returns: events (list) - the generated events, from the most recent to the oldest as the GitHub Events API reports them
+    '''
+
+    return(EventGenerator(login, seed).generate(num_events, push_bursts, burst_size))
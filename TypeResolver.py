@@ -0,0 +1,104 @@
+import time
+import sqlite3
+import threading
+
+TYPE_TTL = 30 # days
+BOT_SUFFIX = '[bot]'
+TYPES = ['User', 'Bot', 'Organization'] # types of the mapping file, in any letter case
+
+class TypeResolver:
+    '''
+    description: Resolution of the type of a contributor (User, Bot or Organization) without querying the /users endpoint
+                 of the GitHub API when the type is already known, from (in this order):
+                 - the mapping file provided by the user, one "login type" per line
+                 - the [bot] suffix of the login names of GitHub Apps, whose type is always Bot
+                 - the SQLite cache of the types previously reported by the GitHub API, for ttl days
+                 Contributors of type User are then only queried through the Events API, that also reports if they are invalid.
+    '''
+
+    def __init__(self, cache_path=None, mapping_path=None, ttl=TYPE_TTL):
+        '''
+        args: cache_path (str) - path of the SQLite cache of the types reported by the GitHub API, created if needed.
+                                 None to not cache the types.
+              mapping_path (str) - path of the mapping file with the type of contributors, None if there is none
+              ttl (float) - number of days during which a cached type is used
+        '''
+
+        self.ttl = ttl*24*3600
+        self.mapping = {}
+        if mapping_path is not None:
+            self.mapping = self.read_mapping(mapping_path)
+        self._lock = threading.Lock()
+        self._connection = None
+        if cache_path is not None:
+            self._connection = sqlite3.connect(cache_path, check_same_thread=False)
+            with self._lock, self._connection:
+                self._connection.execute('CREATE TABLE IF NOT EXISTS types (login TEXT PRIMARY KEY, type TEXT, stored_at REAL)')
+
+    @staticmethod
+    def read_mapping(mapping_path):
+        '''
+        args: mapping_path (str) - path of the mapping file, one "login type" per line
+
+        returns: mapping (dict) - type of each login name of the mapping file, with the letter case of TYPES (e.g., user is User)
+        '''
+
+        mapping = {}
+        with open(mapping_path, encoding='utf-8') as mapping_file:
+            for line_number, line in enumerate(mapping_file, start=1):
+                fields = line.split()
+                if len(fields) == 0:
+                    continue
+                if len(fields) != 2:
+                    raise ValueError(f'Line {line_number} of {mapping_path} should be a login name and a type separated by a space.')
+                contributor_type = {known_type.lower(): known_type for known_type in TYPES}.get(fields[1].lower())
+                if contributor_type is None:
+                    raise ValueError(f'Line {line_number} of {mapping_path} has the type {fields[1]}, the type should be one of {", ".join(TYPES)}.')
+                mapping[fields[0]] = contributor_type
+
+        return(mapping)
+
+    def resolve(self, login):
+        '''
+        args: login (str) - login name of the contributor
+
+        returns: contributor_type (str) - the type of the contributor, None if it is not known
+        '''
+
+        login = str(login) # an all-digit login name read by pandas is an int
+        if login in self.mapping:
+            return(self.mapping[login])
+        if login.endswith(BOT_SUFFIX):
+            return('Bot')
+        if self._connection is None:
+            return(None)
+        with self._lock:
+            row = self._connection.execute('SELECT type, stored_at FROM types WHERE login = ?', (login,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return(None)
+
+        return(row[0])
+
+    def store(self, login, contributor_type):
+        '''
+        args: login (str) - login name of the contributor
+              contributor_type (str) - type of the contributor reported by the GitHub API
+
+        returns: None
+        '''
+
+        if self._connection is None:
+            return
+        with self._lock, self._connection:
+            self._connection.execute('INSERT OR REPLACE INTO types VALUES (?, ?, ?)', (str(login), contributor_type, time.time()))
+
+    def close(self):
+        '''
+        args: None
+
+        returns: None
+        '''
+
+        if self._connection is not None:
+            with self._lock:
+                self._connection.close()
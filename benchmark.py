@@ -0,0 +1,247 @@
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import warnings
+import pandas as pd
+
+import ExtractEvent as eev
+import GenerateActivities as gat
+import important_features as imf
+import SyntheticEvents as sev
+
+SIZES = [100, 1000, 10000, 100000] # numbers of events
+REPEAT = 3
+MAX_PAGES = 10 # pages of 100 events of the MakePrediction benchmark, larger numbers of events are not timed with it
+TOLERANCE = 0.25 # relative slowdown over the baseline reported as a regression
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json') # results of the reference tree
+MIN_SLOWDOWN = 0.005 # seconds, smaller slowdowns are timing noise and never reported as a regression
+# rule functions of GenerateActivities, timed while activity_identification runs
+RULES = ['SimpleActivities', 'PublishingRelease', 'CreatingTag', 'TransferingIssue', 'OpeningIssue', 'ClosingIssue',
+         'ReopeningIssue', 'CommentingIssue', 'ReopeningPullRequest', 'ClosingPullRequest', 'CommentingPullRequest',
+         'CommentingPullRequestChanges', 'ReviewingCode', 'PushingCommits']
+
+def timed(function, repeat, *args):
+    '''
+    args: function (function) - function to time
+          repeat (int) - number of runs
+          args - arguments of the function, built again for each run by calling them (e.g., to copy a DataFrame that is modified)
+
+    returns: duration (float) - the shortest duration of a run, in seconds
+             result - the result of the last run
+    '''
+
+    durations = []
+    for _ in range(repeat):
+        call_args = [arg() for arg in args]
+        started = time.perf_counter()
+        result = function(*call_args)
+        durations.append(time.perf_counter() - started)
+
+    return(min(durations), result)
+
+def time_rules(df_events, repeat):
+    '''
+    args: df_events (DataFrame) - unpacked events
+          repeat (int) - number of runs
+
+    returns: durations (dict) - the shortest total duration of each rule function of GenerateActivities during activity_identification,
+                                in seconds, 0.0 for the rules that are not invoked for the events
+
+    description: The rule functions are replaced by timed wrappers, so that they are timed with the events they get in
+                 activity_identification.
+    '''
+
+    originals = {rule: getattr(gat, rule) for rule in RULES}
+    best = {rule: float('inf') for rule in RULES}
+    try:
+        for _ in range(repeat):
+            totals = {rule: 0.0 for rule in RULES}
+            def wrap(rule):
+                def timed_rule(*args):
+                    started = time.perf_counter()
+                    result = originals[rule](*args)
+                    totals[rule] = totals[rule] + time.perf_counter() - started
+                    return(result)
+                return(timed_rule)
+            for rule in RULES:
+                setattr(gat, rule, wrap(rule))
+            gat.activity_identification(df_events.copy())
+            best = {rule: min(best[rule], totals[rule]) for rule in RULES}
+    finally:
+        for rule, function in originals.items():
+            setattr(gat, rule, function)
+
+    return(best)
+
+def run_benchmarks(sizes, repeat, push_bursts=0, seed=0):
+    '''
+    args: sizes (list) - numbers of events
+          repeat (int) - number of runs, the shortest duration is reported
+          push_bursts (int) - number of bursts of PushEvents within 2 seconds per 1000 events (see SyntheticEvents.push_burst)
+          seed (int) - seed of the synthetic events
+
+    returns: results (dict) - duration in seconds of each benchmark (e.g., unpackJson, rule/PushingCommits) for each number of events
+    '''
+
+    results = {}
+    for size in sizes:
+        json_response = sev.generate_events('synthetic-contributor', size, seed, push_bursts=push_bursts*size//1000)
+        durations = {}
+        durations['unpackJson'], events = timed(eev.unpackJson, repeat, lambda: json_response)
+        df_events = pd.DataFrame.from_dict(events, orient='columns')
+        durations['activity_identification'], activities = timed(gat.activity_identification, repeat, lambda: df_events.copy())
+        for rule, duration in time_rules(df_events, repeat).items():
+            durations['rule/'+rule] = duration
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            durations['extract_features'], features = timed(imf.extract_features, repeat, lambda: activities.copy())
+            if(size <= MAX_PAGES*100):
+                durations['MakePrediction'], result = timed(make_prediction, repeat, lambda: json_response)
+        for name, duration in durations.items():
+            results.setdefault(name, {})[str(size)] = duration
+        print(f'{size} events: {len(activities)} activities', file=sys.stderr)
+
+    return(results)
+
+def scaling(durations):
+    '''
+    args: durations (dict) - duration of a benchmark for each number of events
+
+    returns: exponent (float) - growth exponent of the duration with the number of events between the two largest numbers of
+                                events (1.0 for linear, 2.0 for quadratic), None if it cannot be computed
+    '''
+
+    sizes = sorted(durations, key=int)
+    if(len(sizes) < 2 or durations[sizes[-2]] <= 0 or durations[sizes[-1]] <= 0):
+        return(None)
+
+    return(math.log(durations[sizes[-1]]/durations[sizes[-2]])/math.log(int(sizes[-1])/int(sizes[-2])))
+
+def compare(results, baseline, tolerance):
+    '''
+    args: results (dict) - see run_benchmarks
+          baseline (dict) - results of a previous run, in the same format
+          tolerance (float) - relative slowdown over the baseline that is reported as a regression
+
+    returns: report (DataFrame) - duration of each benchmark for each number of events, with the baseline and the ratio
+             regressions (list) - (benchmark, number of events) of the durations that are slower than the baseline by more than
+                                  tolerance, and by more than MIN_SLOWDOWN seconds
+    '''
+
+    rows = []
+    regressions = []
+    for name, durations in results.items():
+        for size, duration in durations.items():
+            baseline_duration = baseline.get(name, {}).get(size)
+            ratio = duration/baseline_duration if baseline_duration else None
+            if(ratio is not None and ratio > 1 + tolerance and duration - baseline_duration > MIN_SLOWDOWN):
+                regressions.append((name, int(size)))
+            rows.append({'benchmark': name, 'events': int(size), 'seconds': round(duration, 5),
+                         'baseline': None if baseline_duration is None else round(baseline_duration, 5),
+                         'ratio': None if ratio is None else round(ratio, 2)})
+
+    return(pd.DataFrame(rows), regressions)
+
+def report(results, baseline=None, tolerance=TOLERANCE):
+    '''
+    args: results (dict) - see run_benchmarks
+          baseline (dict) - results of a previous run to compare with, None if there is none
+          tolerance (float) - relative slowdown over the baseline that is reported as a regression
+
+    returns: regressions (list) - see compare
+    '''
+
+    curves = (pd.DataFrame(results)
+              .T
+              .rename(columns=lambda size: f'{size} events')
+              .assign(scaling=[scaling(durations) for durations in results.values()])
+              .round(5))
+    print('Duration in seconds and growth exponent between the two largest numbers of events (1.0 for linear):')
+    print(curves.to_string())
+    if(baseline is None):
+        return([])
+
+    comparison, regressions = compare(results, baseline, tolerance)
+    print(f'\nComparison with the baseline (regression if the ratio is above {1 + tolerance}):')
+    print(comparison.to_string(index=False))
+    for name, size in regressions:
+        print(f'Regression: {name} with {size} events')
+
+    return(regressions)
+
+def make_prediction(json_response):
+    '''
+    args: json_response (list) - events, from the most recent to the oldest
+
+    returns: result (DataFrame) - the result of rabbit.MakePrediction
+
+    description: Process the events page after page as MakePrediction does with the pages of the GitHub Events API, with the prediction
+                 deferred so that the model is not invoked.
+    '''
+
+    import rabbit # only needed for this benchmark, it loads scikit-learn
+    pages = [(pd.DataFrame.from_dict(eev.unpackJson(json_response[first:first+100]), orient='columns'), False) for first in range(0, len(json_response), 100)]
+
+    return(rabbit.MakePrediction('synthetic-contributor', None, 1, 1.0, len(pages), False, defer_prediction=True, pages=pages))
+
+def arg_parser():
+    parser = argparse.ArgumentParser(description='Micro-benchmarks of the event processing of RABBIT on synthetic GitHub events')
+    parser.add_argument(
+        '--sizes', metavar='EVENTS', type=int, nargs='+', required=False, default=SIZES,
+        help=f'Numbers of events of the synthetic contributor. The default numbers are {SIZES}.')
+    parser.add_argument(
+        '--repeat', metavar='REPEAT', type=int, required=False, default=REPEAT,
+        help=f'Number of runs of each benchmark, the shortest duration is reported. The default is {REPEAT}.')
+    parser.add_argument(
+        '--push-bursts', metavar='BURSTS', type=int, required=False, default=0,
+        help='Number of bursts of 300 PushEvents within 2 seconds per 1000 events, the adversarial case of the pairing of events. \
+The default is 0.')
+    parser.add_argument(
+        '--seed', metavar='SEED', type=int, required=False, default=0,
+        help='Seed of the synthetic events. The default is 0.')
+    parser.add_argument(
+        '--baseline', metavar='FILE_NAME.json', type=str, required=False, default=None,
+        help=f'Results of a previous run to compare with, the run fails if a benchmark is slower than the baseline by more than the tolerance. \
+The default is {os.path.basename(BASELINE)}, the results of the reference tree, unless the results are saved with --save.')
+    parser.add_argument(
+        '--tolerance', metavar='TOLERANCE', type=float, required=False, default=TOLERANCE,
+        help=f'Relative slowdown over the baseline that is reported as a regression. The default is {TOLERANCE}.')
+    parser.add_argument(
+        '--save', metavar='FILE_NAME.json', type=str, required=False, default=None,
+        help='Save the results, to be used as the baseline of a later run.')
+
+    return parser.parse_args()
+
+def main():
+    '''
+    args: None
+
+    returns: None
+
+    description: Run the benchmarks, report the scaling curves and compare them with the baseline (BASELINE by default).
+                 Exit with status 1 if there is a regression, or if the baseline is not found.
+    '''
+
+    args = arg_parser()
+    baseline = None
+    baseline_path = args.baseline if args.baseline is not None or args.save is not None else BASELINE
+    if baseline_path is not None:
+        if not os.path.exists(baseline_path):
+            sys.exit(f'No baseline found at {baseline_path}, save the results of the reference tree with: python benchmark.py --save {baseline_path}')
+        with open(baseline_path) as baseline_file:
+            baseline = json.load(baseline_file)
+    results = run_benchmarks(args.sizes, args.repeat, args.push_bursts, args.seed)
+    regressions = report(results, baseline, args.tolerance)
+    if args.save is not None:
+        with open(args.save, 'w') as save_file:
+            json.dump(results, save_file, indent=4)
+    if baseline is not None and not any(size in baseline.get(name, {}) for name, durations in results.items() for size in durations):
+        sys.exit(f'The baseline {baseline_path} has none of the benchmarked numbers of events ({", ".join(map(str, args.sizes))}).')
+    if len(regressions) > 0:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -230,7 +230,7 @@ def extract_features(df):
     NAT: number of activities per type (mean, median, std, gini and IQR).
     '''
 
-    df['date'] = pd.to_datetime(df.date, errors='coerce', format='%Y-%m-%dT%H:%M:%S+00:00').dt.tz_localize(None)
+    df['date'] = pd.to_datetime(df.date, errors='coerce', format='%Y-%m-%dT%H:%M:%S+00:00', utc=True).dt.tz_localize(None)
     df[['owner','repo']]=df.repository.str.split('/', expand=True)
     
     # active_contributors = list(df_active_contib_activities.contributor.unique())
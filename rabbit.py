@@ -2,9 +2,15 @@ import pandas as pd
 import numpy as np
 import warnings
 import requests
+import os
 import sys
 import argparse
 import time
+import math
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+import multiprocessing
 from sklearn.ensemble import GradientBoostingClassifier
 import joblib
 import site
@@ -14,6 +20,15 @@ import GenerateActivities as gat
 import ExtractEvent as eev
 # import ComputeFeatures as cfe
 import important_features as imf
+import ResponseCache as rsc
+import ResultStore as rst
+import ResultWriter as rwr
+import CheckpointJournal as cpj
+import AsyncClient as acl
+import TypeResolver as trs
+import GHArchive as gha
+import EventArchive as eva
+import EventStore as evs
 
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
@@ -22,6 +37,9 @@ from importlib.resources import files
 TIMEOUT_WAITING_TIME = 30
 CONNECTION_ERROR_WAITING_TIME = 10
 QUERY_LIMIT_RESET_OVERHEAD_TIME = 120
+QUERY_ROOT = "https://api.github.com"
+SESSION_POOL_SIZE = 10 # number of connections kept alive to the GitHub API per API key
+API_KEYS_VARIABLE = 'RABBIT_API_KEYS'
 ALL_FEATURES = ['events', 'NA','NT','NOR','ORR',
                 'DCA_mean','DCA_median','DCA_std','DCA_gini',
                 'NAR_mean','NAR_median','NAR_gini','NAR_IQR',
@@ -31,6 +49,12 @@ ALL_FEATURES = ['events', 'NA','NT','NOR','ORR',
                 'DAAR_mean','DAAR_median','DAAR_std','DAAR_gini','DAAR_IQR',
                 'DCAT_mean','DCAT_median','DCAT_std','DCAT_gini','DCAT_IQR',
                 'NAT_mean','NAT_median','NAT_std','NAT_gini','NAT_IQR']
+MODEL_FEATURES = ALL_FEATURES[1:] # features used by BIMBAS, all but the number of events
+MODEL_FILE = 'bimbas.joblib'
+
+_model = None # process-wide model, see get_model
+_model_version = None # hash of the process-wide model, see get_model_version
+_model_lock = threading.Lock()
 
 def time_to_pause(nextResetTime):
     '''    
@@ -50,24 +74,105 @@ def time_to_pause(nextResetTime):
     timeDiff = (ResetTime - datetime.now()).total_seconds() + QUERY_LIMIT_RESET_OVERHEAD_TIME
     return timeDiff, ResetTime
 
-def get_model():
+def load_model(model_path=None):
     '''
-    args: None
+    args: model_path (str/Path) - path to a joblib file with a trained model. If None, the bundled BIMBAS model is used
 
-    returns: bot_identification_model (json); Json file with trained model parameters
-    
-    description: Load the bot identification model
-    '''
+    returns: bot_identification_model (sklearn estimator) - the trained model, freshly unpickled from disk
 
-    model_file = 'bimbas.joblib'
+    description: Load the bot identification model from disk. This always reads the file, use get_model to
+                 benefit from the process-wide model that is loaded only once.
+    '''
 
     try:
-        resource_path = files("rabbit").joinpath(model_file) # Produced with scikit-learn 1.5 
-        bot_identification_model = joblib.load(resource_path)
+        if model_path is None:
+            model_path = files("rabbit").joinpath(MODEL_FILE) # Produced with scikit-learn 1.5 
+        bot_identification_model = joblib.load(model_path)
         return(bot_identification_model)
     except Exception as e:
         raise RuntimeError(f"Failed to load the model: {e}")
 
+def set_model(model):
+    '''
+    args: model (sklearn estimator) - an already loaded model that exposes predict_proba
+
+    returns: None
+
+    description: Register the model to be used by RABBIT for the rest of the process. This is meant for library
+                 users that already have the model in memory (or want to use another one), so that the bundled
+                 model is never read from disk.
+    '''
+
+    global _model, _model_version
+    with _model_lock:
+        _model = model
+        _model_version = None
+
+def get_model():
+    '''
+    args: None
+
+    returns: bot_identification_model (sklearn estimator) - the trained model
+
+    description: Return the process-wide bot identification model. The model is loaded from disk the first
+                 time it is requested (or when preload_model is called) and reused for all contributors afterwards.
+    '''
+
+    global _model
+    if _model is None:
+        with _model_lock:
+            if _model is None:
+                _model = load_model()
+    return(_model)
+
+def get_model_version():
+    '''
+    args: None
+
+    returns: model_version (str) - hash of the process-wide model
+
+    description: Identify the model with which the results were determined, so that the stored results
+                 (see ResultStore) are not reused with another model.
+    '''
+
+    global _model_version
+    if _model_version is None:
+        model = get_model()
+        with _model_lock:
+            if _model_version is None:
+                _model_version = joblib.hash(model)
+    return(_model_version)
+
+def preload_model(model_path=None):
+    '''
+    args: model_path (str/Path) - path to a joblib file with a trained model. If None, the bundled BIMBAS model is used
+
+    returns: bot_identification_model (sklearn estimator) - the trained model
+
+    description: Eagerly load the model (if it is not loaded yet) so that loading errors are raised before
+                 querying GitHub, instead of in the middle of processing the first contributor.
+    '''
+
+    if model_path is not None:
+        set_model(load_model(model_path))
+    return(get_model())
+
+def warm_up_model():
+    '''
+    args: None
+
+    returns: None
+
+    description: Run the model once on a dummy feature vector, so that the one-time costs of the first
+                 prediction (input validation setup, lazy imports) are not paid while processing a contributor.
+    '''
+
+    model = get_model()
+    dummy_features = pd.DataFrame([[0.0]*len(MODEL_FEATURES)], columns=MODEL_FEATURES)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        model.predict_proba(dummy_features)
+
 def compute_confidence(probability_value):
     '''
     args: probability_value (float) - the bot probability value given by the model
@@ -86,6 +191,31 @@ def compute_confidence(probability_value):
 
     return(contributor_type,confidence)
 
+def predict_batch(activity_features):
+    '''
+    args: activity_features (DataFrame) - features of one or more contributors (one row per contributor, indexed by contributor name)
+
+    returns: contributor_types (list) - type of each contributor ('Bot' or 'Human'), in the order of the rows
+             confidences (list) - confidence score of each determined type, in the order of the rows
+
+    description: Score all the given contributors with a single call to the model and split the bot probabilities
+                 back into per-contributor type and confidence, exactly as compute_confidence does for one contributor.
+    '''
+
+    model = get_model()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=UserWarning)
+        probability = model.predict_proba(activity_features[MODEL_FEATURES].astype('float'))
+
+    contributor_types = []
+    confidences = []
+    for probability_value in probability[:, 1]:
+        contributor_type, confidence = compute_confidence(probability_value)
+        contributor_types.append(contributor_type)
+        confidences.append(confidence)
+
+    return(contributor_types, confidences)
+
 def frame_direct_result(determined_type, confidence, result_cols, contributor):
     '''
     args: determined_type (str) - type determined by GitHub Users API or Unknown or Invalid
@@ -130,21 +260,233 @@ def format_result(result, verbose):
     
     return(result)
 
-def check_ratelimit(ratelimit, nextResetTime, max_queries):
+class RateLimitBudget:
+    '''
+    description: API rate limit budget of an API key, shared by all the threads that query GitHub with it. When the
+                 remaining number of queries drops below what the contributors being processed may still need, the
+                 API key is paused for every thread until the next reset time, instead of each thread deciding on its own.
+    '''
+
+    def __init__(self, workers=1):
+        '''
+        args: workers (int) - number of contributors that are processed at the same time
+        '''
+
+        self.workers = workers
+        self.remaining = None # remaining rate limit, None until the first response
+        self._lock = threading.Lock()
+        self._resume_at = 0.0 # time.time() at which querying can resume
+        self._reset_time = 0 # reset time that caused the last pause
+
+    def update(self, ratelimit, nextResetTime, max_queries):
+        '''
+        args: ratelimit (int) - remaining rate limit reported by the last response
+              nextResetTime (int) - time at which the API rate limit will be reset, reported by the last response
+              max_queries (int) - maximum number of queries per contributor
+
+        returns: pause (float) - time (in seconds) for which querying is paused, None if querying is not paused
+                 ResetTime (datetime.datetime) - the time at which the next reset happens, None if querying is not paused
+
+        description: Record the rate limit of a response, and pause querying until the next reset time if the
+                     remaining rate limit is lower than the maximum number of queries of all the workers.
+        '''
+
+        with self._lock:
+            # A response sent before the last reset may arrive late, it must not pause querying again
+            if int(nextResetTime) >= self._reset_time:
+                self.remaining = ratelimit
+            if ratelimit < max_queries*self.workers and int(nextResetTime) > self._reset_time:
+                pause, ResetTime = time_to_pause(nextResetTime)
+                self._reset_time = int(nextResetTime)
+                self._resume_at = time.time() + pause
+                return(pause, ResetTime)
+        return(None, None)
+
+    def paused_until(self):
+        '''
+        args: None
+
+        returns: resume_at (float) - time.time() at which querying can resume, in the past if querying is not paused
+        '''
+
+        return(self._resume_at)
+
+    def wait(self):
+        '''
+        args: None
+
+        returns: None
+
+        description: Sleep until querying is allowed again, return immediately if querying is not paused.
+        '''
+
+        pause = self._resume_at - time.time()
+        if pause > 0:
+            time.sleep(pause)
+
+def print_pause(pause_state):
+    '''
+    args: pause_state (dict) - see KeyPool.status, with the remaining rate limit, pause and ResetTime of the paused API key
+
+    returns: None
+
+    description: Default pause callback of the KeyPool, print that querying is paused
+    '''
+
+    print(pause_message(pause_state))
+
+def pause_message(pause_state):
+    '''
+    args: pause_state (dict) - see print_pause
+
+    returns: message (str) - message that querying is paused
+    '''
+
+    message = "Remaining API query limit is {0}. Querying paused for {1}s until next reset time: {2}".format(pause_state['ratelimit'], pause_state['pause'], pause_state['ResetTime'])
+    if pause_state['keys'] > 1:
+        message = message + " ({0} of {1} API keys paused)".format(pause_state['paused_keys'], pause_state['keys'])
+
+    return(message)
+
+def show_pause(progress, pause_state):
+    '''
+    args: progress (tqdm) - progress bar of the contributors
+          pause_state (dict) - see print_pause
+
+    returns: None
+
+    description: Pause callback used while the progress bar is displayed, the message is written above the progress bar
+                 and the progress bar shows until when querying is paused.
+    '''
+
+    tqdm.write(pause_message(pause_state))
+    if pause_state['resume_at'] is not None:
+        progress.set_postfix_str('querying paused until {0}'.format(datetime.fromtimestamp(pause_state['resume_at']).strftime('%Y-%m-%d %H:%M:%S')))
+
+class KeyPool:
+    '''
+    description: Rate limit budgets of all the API keys. Each query is made with the API key that has the most
+                 remaining queries among the ones that are not paused, querying only sleeps when all the API keys
+                 are paused until their next reset time. Only the queries wait for the rate limit: the contributors
+                 whose events were already queried go on with the identification of their activities and type.
+    '''
+
+    def __init__(self, workers=1, pause_callback=print_pause):
+        '''
+        args: workers (int) - number of contributors that are processed at the same time
+              pause_callback (function) - called with the pause state (see status) each time an API key is paused
+        '''
+
+        self._workers = workers
+        self._budgets = {}
+        self._lock = threading.Lock()
+        self.pause_callback = pause_callback
+
+    def status(self):
+        '''
+        args: None
+
+        returns: pause_state (dict) - keys: number of API keys in use
+                                      paused_keys: number of API keys that are paused
+                                      resume_at: time.time() at which querying can resume with one of the API keys,
+                                                 None if at least one API key is not paused
+        '''
+
+        now = time.time()
+        with self._lock:
+            resume_times = [budget.paused_until() for budget in self._budgets.values()]
+        paused = [resume_at for resume_at in resume_times if resume_at > now]
+        pause_state = {'keys': len(resume_times),
+                       'paused_keys': len(paused),
+                       'resume_at': min(paused) if len(paused) == len(resume_times) and len(paused) > 0 else None}
+
+        return(pause_state)
+
+    def set_workers(self, workers):
+        '''
+        args: workers (int) - number of contributors that are processed at the same time
+
+        returns: None
+        '''
+
+        with self._lock:
+            self._workers = workers
+            for budget in self._budgets.values():
+                budget.workers = workers
+
+    def budget(self, key):
+        '''
+        args: key (str) - the API key, None for unauthenticated queries
+
+        returns: budget (RateLimitBudget) - the rate limit budget of the API key
+        '''
+
+        with self._lock:
+            if key not in self._budgets:
+                self._budgets[key] = RateLimitBudget(self._workers)
+            return(self._budgets[key])
+
+    def select(self, keys):
+        '''
+        args: keys (str/list) - the API key or the list of API keys that can be used
+
+        returns: key (str) - the API key to use for the next query
+
+        description: Return the API key with the most remaining queries among the ones that are not paused. An API key
+                     that was not used yet is preferred, since its rate limit is unknown. The remaining queries of the
+                     selected API key are decreased right away, so that concurrent queries are spread over the API keys.
+                     If all the API keys are paused, sleep until the first one can be used again.
+        '''
+
+        if not isinstance(keys, (list, tuple)):
+            keys = [keys]
+        budgets = [(key, self.budget(key)) for key in keys]
+        while True:
+            now = time.time()
+            with self._lock:
+                available = [(key, budget) for key, budget in budgets if budget.paused_until() <= now]
+                if len(available) > 0:
+                    key, budget = max(available, key=lambda item: float('inf') if item[1].remaining is None else item[1].remaining)
+                    if budget.remaining is not None:
+                        budget.remaining = budget.remaining - 1
+                    return(key)
+            pause = min(budget.paused_until() for key, budget in budgets) - now
+            if pause > 0:
+                time.sleep(pause)
+
+    def update(self, key, ratelimit, nextResetTime, max_queries):
+        '''
+        args: key (str) - the API key with which the query was made
+              ratelimit (int) - remaining rate limit reported by the response
+              nextResetTime (int) - time at which the API rate limit will be reset, reported by the response
+              max_queries (int) - maximum number of queries per contributor
+
+        returns: None
+        '''
+
+        pause, ResetTime = self.budget(key).update(ratelimit, nextResetTime, max_queries)
+        if pause is not None and self.pause_callback is not None:
+            pause_state = self.status()
+            pause_state.update({'ratelimit': ratelimit, 'pause': pause, 'ResetTime': ResetTime})
+            self.pause_callback(pause_state)
+
+key_pool = KeyPool()
+
+def check_ratelimit(ratelimit, nextResetTime, max_queries, key=None):
     '''
     args: rate limit (int) - remaining rate limit for the provided API key
           nextResetTime (int) - time at which the API rate limit will be reset
           max_queries (int) - maximum number of queries per contributor
+          key (str) - the API key with which the query was made
         
     returns: None
 
-    description: Get the time at which the API rate limit will be reset, calculate its difference from 
-                 current time + some time overhead and sleep for that much time.
+    description: Record the remaining rate limit of the API key. If it is too low, the API key is paused until
+                 the time at which the API rate limit will be reset + some time overhead. The budget is shared
+                 between all the workers, and the next query only sleeps if all the API keys are paused (see KeyPool).
     '''
-    if ratelimit < max_queries:
-        pause, ResetTime = time_to_pause(nextResetTime)
-        print("Remaining API query limit is {0}. Querying paused for {1}s until next reset time: {2}".format(ratelimit, pause, ResetTime))
-        time.sleep(pause)
+
+    key_pool.update(key, ratelimit, nextResetTime, max_queries)
 
 def timeout_exception():
     '''
@@ -170,26 +512,114 @@ def connection_error_exception():
     time.sleep(CONNECTION_ERROR_WAITING_TIME)
     print('Retrying...')
 
+_sessions = {} # one HTTP session per API key, see get_session
+_sessions_lock = threading.Lock()
+
+def create_session(key, pool_size):
+    '''
+    args: key (str) - the API key, None for unauthenticated queries
+          pool_size (int) - maximum number of connections kept alive to the GitHub API
+    
+    returns: session (requests.Session) - HTTP session to query the GitHub API
+
+    description: Create an HTTP session whose connections to the GitHub API are kept alive and reused between
+                 queries, so that each query does not pay a new TCP and TLS handshake. The headers, including the
+                 authorization for the API key, are set once for all the queries made through the session.
+    '''
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.headers.update({'Accept': 'application/vnd.github+json',
+                            'Accept-Encoding': 'gzip',
+                            'Connection': 'keep-alive'})
+    if key:
+        session.headers['Authorization'] = 'token ' + key
+
+    return(session)
+
+def get_session(key):
+    '''
+    args: key (str) - the API key, None for unauthenticated queries
+    
+    returns: session (requests.Session) - HTTP session to query the GitHub API with the given key
+
+    description: Return the session shared by all the queries made with the given API key, creating it on first use.
+    '''
+
+    with _sessions_lock:
+        if key not in _sessions:
+            _sessions[key] = create_session(key, SESSION_POOL_SIZE)
+        return(_sessions[key])
+
+def configure_session(pool_size=None):
+    '''
+    args: pool_size (int) - maximum number of connections kept alive to the GitHub API per API key
+    
+    returns: None
+
+    description: Change the settings of the HTTP sessions. The existing sessions are closed, new ones are created
+                 with the given settings on the next query.
+    '''
+
+    global SESSION_POOL_SIZE
+    with _sessions_lock:
+        if pool_size is not None:
+            SESSION_POOL_SIZE = pool_size
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+response_cache = None # on-disk cache of the GitHub API responses, see configure_cache
+
+def configure_cache(cache_dir=None, max_size=rsc.CACHE_MAX_SIZE, max_age=rsc.CACHE_MAX_AGE):
+    '''
+    args: cache_dir (str) - directory of the on-disk cache of the GitHub API responses, None to disable the cache
+          max_size (float) - maximum size of the cache, in MB
+          max_age (float) - maximum number of days since a cached response was last used
+    
+    returns: None
+
+    description: Enable or disable the on-disk cache of the GitHub API responses (see ResponseCache)
+    '''
+
+    global response_cache
+    if cache_dir is None:
+        response_cache = None
+    else:
+        response_cache = rsc.ResponseCache(cache_dir, max_size, max_age)
+
+def query_api(key, query):
+    '''
+    args: key (str) - the API key, None for unauthenticated queries
+          query (str) - the URL to query
+    
+    returns: response (requests.Response) - the response of the GitHub API
+
+    description: Query the GitHub API through the session of the API key, and through the response cache if it is enabled.
+    '''
+
+    if response_cache is None:
+        return(get_session(key).get(query))
+
+    return(response_cache.get(get_session(key), key, query))
+
 def QueryUser(contributor, key, max_queries):
     '''
     args: contributor (str) - contributor name
-          key (str) - the API key
+          key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
     
     returns: contributor_type (str) - type of the contributor (e.g., "Bot", "User", "Organization")
              query_failed (bool) - a boolean value to indicate if the query failed or success
     '''
 
-    QUERY_ROOT = "https://api.github.com"
     query_failed = False
     contributor_type = None
 
     try:
+        key = key_pool.select(key)
         query = f'{QUERY_ROOT}/users/{contributor}'
-        if key:
-            headers = {'Authorization': 'token ' + key}
-            response = requests.get(query, headers=headers)
-        else:
-            response = requests.get(query)
+        response = query_api(key, query)
 
         if response.ok:
             json_response = response.json()
@@ -198,7 +628,7 @@ def QueryUser(contributor, key, max_queries):
             else:
                 contributor_type = json_response['type']
             
-            check_ratelimit(int(response.headers['X-RateLimit-Remaining']), int(response.headers['X-RateLimit-Reset']), max_queries)
+            check_ratelimit(int(response.headers['X-RateLimit-Remaining']), int(response.headers['X-RateLimit-Reset']), max_queries, key)
         
         else:
             query_failed = True
@@ -210,59 +640,367 @@ def QueryUser(contributor, key, max_queries):
     
     return(contributor_type, query_failed)
 
+type_resolver = trs.TypeResolver() # types of contributors known without querying the GitHub API, see configure_type_resolver
+
+def configure_type_resolver(cache_path=None, mapping_path=None, ttl=trs.TYPE_TTL):
+    '''
+    args: cache_path (str) - path of the SQLite cache of the types reported by the GitHub API, None to not cache the types
+          mapping_path (str) - path of the mapping file with the type of contributors, None if there is none
+          ttl (float) - number of days during which a cached type is used
+    
+    returns: None
+
+    description: Change the sources of the types of contributors that are known without querying the GitHub API (see TypeResolver).
+                 The [bot] suffix of GitHub Apps is always used.
+    '''
+
+    global type_resolver
+    type_resolver.close()
+    type_resolver = trs.TypeResolver(cache_path, mapping_path, ttl)
+
+def resolve_type(contributor, key, max_queries):
+    '''
+    args: contributor (str) - contributor name
+          key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+          max_queries (int) - maximum number of queries per contributor
+    
+    returns: contributor_type (str) - type of the contributor (e.g., "Bot", "User", "Organization")
+             query_failed (bool) - a boolean value to indicate if the query failed or success
+
+    description: Return the type of the contributor if it is already known (see TypeResolver), otherwise query it with
+                 QueryUser, cache the reported type and archive it if the event archive is enabled.
+    '''
+
+    contributor_type = type_resolver.resolve(contributor)
+    if contributor_type is not None:
+        return(contributor_type, False)
+
+    contributor_type, query_failed = QueryUser(contributor, key, max_queries)
+    if contributor_type is not None and not query_failed:
+        type_resolver.store(contributor, contributor_type)
+    if event_archive is not None and (contributor_type is not None or query_failed):
+        # the contributors that are not users have no archived events, their type is reported from the archive (see PredictArchived)
+        event_archive.store_type(contributor, 'Invalid' if query_failed else contributor_type)
+
+    return(contributor_type, query_failed)
+
+event_archive = None # archive of the queried pages of events, see configure_event_archive
+EVENT_ARCHIVE_AND_STORE = 'The events can be either archived (--event-archive) or stored (--event-store), not both: the event store \
+only queries the new events of a contributor, the archive would then only keep their first page.'
+
+def configure_event_archive(archive_dir=None):
+    '''
+    args: archive_dir (str) - directory of the archive of the queried pages of events, None to not archive them
+    
+    returns: None
+
+    description: Enable or disable the archive of the raw pages of events queried from the GitHub API (see EventArchive),
+                 from which the types can be determined again with get_results(from_archive=...) without querying the API.
+                 The archive cannot be used with the event store (see configure_event_store).
+    '''
+
+    global event_archive
+    if archive_dir is not None and event_store is not None:
+        raise ValueError(EVENT_ARCHIVE_AND_STORE)
+    if event_archive is not None:
+        event_archive.close()
+    if archive_dir is None:
+        event_archive = None
+    else:
+        event_archive = eva.EventArchive(archive_dir)
 
 def QueryEvents(contributor, key, page, max_queries):
     '''
     args: contributor (str) - contributor name
-          key (str) - the API key
+          key (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
           page (str) - the events page number to be queried
     
-    returns: list_events (list) - a list of events that were performed by contributor
+    returns: df_events (DataFrame) - the events that were performed by contributor (one row per event, newest first)
              query_failed (bool) - a boolean value to indicate if the query failed or success
 
-    description: Query the GitHub Events API with 100 events per page, unpack the json format to get the required fields and store it in list format
+    description: Query the GitHub Events API with 100 events per page, unpack the json format to get the required fields in a DataFrame.
+                 The raw page is archived if the event archive is enabled (see configure_event_archive).
     '''
 
-    QUERY_ROOT = "https://api.github.com"
     query_failed = False
-    list_event = []
+    df_events = pd.DataFrame()
 
     try:
+        key = key_pool.select(key)
         query = f'{QUERY_ROOT}/users/{contributor}/events?per_page=100&page={page}'
-        if key:
-            headers = {'Authorization': 'token ' + key}
-            response = requests.get(query, headers=headers)
-        else:
-            response = requests.get(query)
+        response = query_api(key, query)
 
         if response.ok:
             json_response = response.json()
+            if event_archive is not None:
+                event_archive.store(contributor, page, json_response)
             if not json_response and page == 1:
-                return(list_event, query_failed)
+                return(df_events, query_failed)
             else:
-                events = eev.unpackJson(json_response)
-                list_event.extend(events)
+                df_events = pd.DataFrame.from_dict(eev.unpackJson(json_response), orient='columns')
             
-            check_ratelimit(int(response.headers['X-RateLimit-Remaining']), int(response.headers['X-RateLimit-Reset']), max_queries)
+            check_ratelimit(int(response.headers['X-RateLimit-Remaining']), int(response.headers['X-RateLimit-Reset']), max_queries, key)
 
         else:
             query_failed = True
-            return(list_event, query_failed)
+            return(df_events, query_failed)
     except requests.exceptions.Timeout as e:
         timeout_exception()
     except requests.ConnectionError as e:
         connection_error_exception()
     
-    return(list_event, query_failed)
+    return(df_events, query_failed)
+
+def create_async_client(concurrency=acl.CONCURRENCY):
+    '''
+    args: concurrency (int) - maximum number of queries in flight
+
+    returns: client (AsyncClient) - asyncio client of the GitHub API, with the same results as QueryUser and QueryEvents
+
+    description: The client shares the HTTP sessions, the response cache and the rate limit budgets of the API keys with
+                 the synchronous queries. The HTTP sessions keep as many connections alive as there are queries in flight.
+    '''
+
+    if concurrency > SESSION_POOL_SIZE:
+        configure_session(pool_size=concurrency)
+
+    return(acl.AsyncClient(QueryUser, QueryEvents, concurrency))
+
+result_store = None # store of the results determined through the events, see configure_result_store
+
+def configure_result_store(store_path=None, ttl=rst.RESULT_TTL, refresh=False):
+    '''
+    args: store_path (str) - path of the SQLite database in which the results are stored, None to disable the store
+          ttl (float) - number of days during which a stored result is reused
+          refresh (bool) - If True, the stored results are not reused, they are determined again and replaced
+    
+    returns: None
+
+    description: Enable or disable the store of the results (see ResultStore)
+    '''
+
+    global result_store
+    if result_store is not None:
+        result_store.close()
+    if store_path is None:
+        result_store = None
+    else:
+        result_store = rst.ResultStore(store_path, ttl, refresh)
+
+def result_settings(min_events, min_confidence, max_queries):
+    '''
+    args: min_events (int) - minimum number of events that a contributor should have performed to determine their type
+          min_confidence (float) - minimum confidence on contributor type to stop further querying
+          max_queries (int) - maximum number of queries to be made to GitHub Events API
+    
+    returns: settings (str) - the settings that, with the events and the model, determine the result of a contributor
+    '''
+
+    return(f'min_events={min_events} min_confidence={min_confidence} max_queries={max_queries}')
+
+def lookup_result(contributor, newest_event, settings):
+    '''
+    args: contributor (str) - login name of the contributor
+          newest_event (str) - id of the newest event of the contributor
+          settings (str) - see result_settings
+    
+    returns: result (DataFrame) - the stored result of the contributor with all the features, None if it has to be determined again
+    '''
+
+    if result_store is None:
+        return(None)
+    stored_result = result_store.lookup(contributor, newest_event, get_model_version(), settings)
+    if stored_result is None:
+        return(None)
+
+    return(pd.DataFrame([stored_result], index=[contributor]))
+
+def store_results(results, settings):
+    '''
+    args: results (DataFrame) - results with all the features, as determined by MakePrediction or predict_pending
+          settings (str) - see result_settings
+    
+    returns: None
+
+    description: Store the results that were determined through the events of the contributors
+    '''
+
+    if result_store is None or settings is None or not results.columns.isin(['newest_event']).any():
+        return
+    for contributor, result in results[results['newest_event'].notnull() & results['type'].notnull()].iterrows():
+        result_store.store(contributor, result['newest_event'], get_model_version(), settings, 
+                           result[['type','confidence']+ALL_FEATURES].to_dict())
+
+_prefetch_executor = None # threads that query the next page of events ahead of time, see get_prefetch_executor
+_prefetch_lock = threading.Lock()
+
+def configure_prefetch(workers=1):
+    '''
+    args: workers (int) - number of contributors that are processed at the same time, each with at most one page being prefetched
+
+    returns: None
+    '''
+
+    global _prefetch_executor
+    with _prefetch_lock:
+        if _prefetch_executor is not None:
+            _prefetch_executor.shutdown(wait=False, cancel_futures=True)
+        _prefetch_executor = ThreadPoolExecutor(max_workers=workers)
+
+def get_prefetch_executor():
+    '''
+    args: None
+
+    returns: executor (ThreadPoolExecutor) - threads that query the next page of events ahead of time, created on first use
+    '''
+
+    global _prefetch_executor
+    with _prefetch_lock:
+        if _prefetch_executor is None:
+            _prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        return(_prefetch_executor)
+
+def init_process(model, store_path, store_ttl, store_refresh):
+    '''
+    args: model (sklearn estimator) - the model of the parent process
+          store_path (str) - path of the result store of the parent process, None if the results are not stored
+          store_ttl (float) - number of days during which a stored result is reused
+          store_refresh (bool) - If True, the stored results are not reused
+    
+    returns: None
+
+    description: Initialize a process of the process pool (see create_process_pool) with the model and the result store of the parent process
+    '''
+
+    set_model(model)
+    warm_up_model()
+    configure_result_store(store_path, store_ttl, store_refresh)
+
+def create_process_pool(processes):
+    '''
+    args: processes (int) - number of processes
+    
+    returns: process_pool (ProcessPoolExecutor) - pool of processes that identify the activities, compute the features and
+                                                  run the model, with the model preloaded in each process
+    '''
+
+    store_path, store_ttl, store_refresh = None, rst.RESULT_TTL, False
+    if result_store is not None:
+        store_path, store_ttl, store_refresh = result_store.store_path, result_store.ttl/(24*3600), result_store.refresh
+
+    return(ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn'),
+                               initializer=init_process, initargs=(get_model(), store_path, store_ttl, store_refresh)))
+
+def query_pages(contributor, apikey, max_queries, settings):
+    '''
+    args: contributor (str) - name of the contributor
+          apikey (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+          max_queries (int) - maximum number of queries to be made to GitHub Events API
+          settings (str) - see result_settings
+    
+    returns: pages (list) - (events, query_failed) of each queried page, as MakePrediction queries them
+             stored_result (DataFrame) - the stored result of the contributor if their newest event did not change, None otherwise
+
+    description: Query all the pages of events of the contributor, until a page is not full or max_queries pages are queried
+    '''
+
+    pages = []
+    for page in range(1, max_queries+1):
+        events, query_failed = QueryEvents(contributor, apikey, page, max_queries)
+        pages.append((events, query_failed))
+        if(len(events)==0):
+            break
+        if(page==1):
+            stored_result = lookup_result(contributor, events['event_id'].iloc[0], settings)
+            if(stored_result is not None):
+                return(pages, stored_result)
+        if(len(events) < 100):
+            break
+
+    return(pages, None)
+
+event_store = None # history of the events of each contributor, see configure_event_store
+
+def configure_event_store(store_path=None):
+    '''
+    args: store_path (str) - path of the SQLite database in which the events of the contributors are stored, None to disable the store
+    
+    returns: None
+
+    description: Enable or disable the store of the events of the contributors (see EventStore and query_history).
+                 The store cannot be used with the event archive (see configure_event_archive).
+    '''
 
-def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries, verbose):
+    global event_store
+    if store_path is not None and event_archive is not None:
+        raise ValueError(EVENT_ARCHIVE_AND_STORE)
+    if event_store is not None:
+        event_store.close()
+    if store_path is None:
+        event_store = None
+    else:
+        event_store = evs.EventStore(store_path)
+
+def query_history(contributor, apikey, max_queries):
+    '''
+    args: contributor (str) - name of the contributor
+          apikey (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
+          max_queries (int) - maximum number of queries to be made to GitHub Events API
+    
+    returns: pages (list) - (events, query_failed) of each page of 100 events of the contributor, from the most recent event to the oldest
+
+    description: Query the pages of events only until an event that is already in the event store is reached, and add the new events
+                 to the store. The pages are then made of the max_queries*100 most recent stored events, which may be older than the
+                 events reported by the GitHub Events API. If some events may be missing between the queried events and the stored
+                 ones (see EventStore.is_contiguous), the stored events are replaced by the queried ones. If a query fails, the
+                 queried pages are returned as they are, without updating the store.
+    '''
+
+    known_events = event_store.event_ids(contributor)
+    pages = []
+    new_events = []
+    known_reached = False
+    for page in range(1, max_queries+1):
+        events, query_failed = QueryEvents(contributor, apikey, page, max_queries)
+        pages.append((events, query_failed))
+        if(query_failed):
+            return(pages)
+        if(len(events)==0):
+            break
+        is_known = events['event_id'].astype(str).isin(known_events).to_numpy()
+        if(is_known.any()):
+            new_events.append(events.iloc[:is_known.argmax()])
+            known_reached = True
+            break
+        new_events.append(events)
+        if(len(events) < 100):
+            break
+
+    history_exhausted = not known_reached and len(pages[-1][0]) < 100
+    contiguous = event_store.is_contiguous(contributor, known_reached, history_exhausted)
+    event_store.store(contributor, pd.concat(new_events) if len(new_events) > 0 else pd.DataFrame(), replace=not contiguous)
+    if(not contiguous):
+        return(pages)
+    history = event_store.history(contributor, max_queries*100)
+
+    return([(history.iloc[first:first+100].reset_index(drop=True), False) for first in range(0, max(len(history), 1), 100)])
+
+def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries, verbose, defer_prediction=False, prefetch=False, process_pool=None, pages=None):
     '''
     args: contributor (str) - name of the contributor for whom the type needs to be determined
-          apikey (str) - the API key
+          apikey (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
           min_events (int) - minimum number of events that a contributor should have performed to determine their type
           min_confidence (float) - minimum confidence on contributor type to stop further querying
           max_queries (int) - maximum number of queries to be made to GitHub Events API
           verbose (bool) - If True, displays the features, #events and #activities that were used to determine the type of contributor
+          defer_prediction (bool) - If True, the model is not invoked. The result keeps all the features, with type and confidence
+                                    left empty, so that it can be scored later together with other contributors (see predict_pending)
+          prefetch (bool) - If True, the next page of events is queried while the current one is processed. The prefetched page
+                            is abandoned if the minimum confidence is reached with the current one.
+          process_pool (ProcessPoolExecutor) - If provided, all the pages of events are queried first, then the activities, features
+                                               and type are determined in a process of the pool (see create_process_pool)
+          pages (list) - (events, query_failed) of the pages of events of a contributor of type User, already queried by query_pages
+                         or query_history, or read from an archive (see PredictArchived)
     
     returns: activity_features (array) - an array of 7 features and the probability that the contributor is a bot
 
@@ -275,31 +1013,58 @@ def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries,
     '''
     
     page=1
-    df_events_obt = pd.DataFrame()
-    activities = pd.DataFrame()
+    num_events = 0
+    num_activities = 0
+    newest_event = None
+    determined_result = None
+    settings = result_settings(min_events, min_confidence, max_queries)
+    pages_obtained = [] # events of the queried pages
     result_cols = ['type','confidence']+ALL_FEATURES
     confidence = 0.0
+    next_page = None # query of the next page of events, made ahead of time with prefetch
+    if defer_prediction:
+        verbose = True # keep the features for the deferred prediction, predict_pending formats the result
 
-    contributor_type, query_failed = QueryUser(contributor, apikey, max_queries)
-    if(contributor_type != 'User' and query_failed==False):
+    if pages is not None:
+        contributor_type, query_failed = 'User', False
+    else:
+        contributor_type, query_failed = resolve_type(contributor, apikey, max_queries)
+    if(contributor_type == 'User' and pages is None and event_store is not None):
+        # only the events that are newer than the stored ones are queried
+        pages = query_history(contributor, apikey, max_queries)
+    if(contributor_type == 'User' and process_pool is not None):
+        # only the queries are made in this thread, the processing of the events is made in another process
+        if(pages is None):
+            pages, stored_result = query_pages(contributor, apikey, max_queries, settings)
+            if(stored_result is not None):
+                return(format_result(stored_result, verbose))
+        return(process_pool.submit(MakePrediction, contributor, apikey, min_events, min_confidence, max_queries, verbose,
+                                   defer_prediction, pages=pages).result())
+    elif(contributor_type != 'User' and query_failed==False):
         # We only need to distinguish bots from humans if the contributor_type is 'User'.
         # In all other cases we just report the type retrieved from the API with 1.0 confidence.
         result = frame_direct_result(contributor_type, 1.0, result_cols, contributor)
         result = format_result(result, verbose)
     elif(contributor_type == 'User'):
         while(page <= max_queries and (confidence != '-' and confidence <= min_confidence)):
-            events, query_failed = QueryEvents(contributor, apikey, page, max_queries)
+            if(pages is not None):
+                events, query_failed = pages[page-1] if page <= len(pages) else (pd.DataFrame(), False)
+            elif(next_page is not None):
+                events, query_failed = next_page.result()
+                next_page = None
+            else:
+                events, query_failed = QueryEvents(contributor, apikey, page, max_queries)
             if(len(events)>0):
-                df_events_obt = pd.concat([df_events_obt, pd.DataFrame.from_dict(events, orient = 'columns')])
-                df_events_obt['created_at'] = pd.to_datetime(df_events_obt.created_at, errors='coerce', format='%Y-%m-%dT%H:%M:%SZ').dt.tz_localize(None)
-                # time_after = pd.to_datetime(time_after, errors='coerce', format='%Y-%m-%d %H:%M:%S').tz_localize(None)
-                
-                # if(df_events_obt['created_at'].min() > time_after):
-                #     time_limit_reached=True
-                # else:
-                #     time_limit_reached=False
-                # df_events_obt = df_events_obt[df_events_obt['created_at']>=time_after].sort_values('created_at')
-                df_events_obt = df_events_obt.sort_values('created_at')
+                if(page==1):
+                    # The result of the contributor is fully determined if their newest event did not change
+                    newest_event = events['event_id'].iloc[0]
+                    stored_result = lookup_result(contributor, newest_event, settings)
+                    if(stored_result is not None):
+                        return(format_result(stored_result, verbose))
+                if(prefetch and len(events) == 100 and page < max_queries):
+                    next_page = get_prefetch_executor().submit(QueryEvents, contributor, apikey, page+1, max_queries)
+                num_events = num_events + len(events)
+                pages_obtained.append(events)
                 # if(len(events) == 100 and time_limit_reached):
                 if(len(events) == 100):
                         page = page + 1
@@ -321,22 +1086,23 @@ def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries,
                 page=max_queries+1 # loop breaking condition
                 # break
         
-            if(df_events_obt.shape[0]>0):
-                activities = gat.activity_identification(df_events_obt)
+            if(num_events>0):
+                activities = gat.activity_identification(pd.concat(pages_obtained))
+                num_activities = activities.shape[0]
             
-            if(len(activities)>0):
+            if(num_activities>0):
                 # with warnings.catch_warnings():
                 #     warnings.simplefilter("ignore", category=RuntimeWarning)
                 activity_features = (
                     imf.extract_features(activities)
                     .set_index([[contributor]])
                 )
-                if(df_events_obt.shape[0]>=min_events):
-                    model = get_model()
-                    with warnings.catch_warnings():
-                        warnings.simplefilter("ignore", category=UserWarning)
-                        probability = model.predict_proba(activity_features)
-                    contributor_type, confidence = compute_confidence(probability[0][1])
+                if(num_events>=min_events and defer_prediction):
+                    contributor_type = None
+                    confidence = 0.0
+                elif(num_events>=min_events):
+                    contributor_types, confidences = predict_batch(activity_features)
+                    contributor_type, confidence = contributor_types[0], confidences[0]
                 
                 else:
                     contributor_type = 'Unknown'
@@ -345,12 +1111,21 @@ def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries,
 
                 result = activity_features.assign(type = contributor_type,
                                                 confidence = confidence,
-                                                events = df_events_obt.shape[0],
-                                                activities = activities.shape[0]
+                                                events = num_events,
+                                                activities = num_activities,
+                                                newest_event = newest_event
                                                 )
+                determined_result = result
             else:
                 result = frame_direct_result('Unknown', result_cols, contributor)
             result = format_result(result, verbose)
+
+        if(next_page is not None):
+            next_page.cancel() # the minimum confidence was reached, the prefetched page is not needed
+        if(determined_result is not None and not defer_prediction):
+            store_results(determined_result, settings)
+        elif(determined_result is not None):
+            result = determined_result # keeps the newest event, predict_pending stores and formats the result
     
     elif(query_failed):
         result = frame_direct_result('Invalid', '-', result_cols, contributor)
@@ -358,19 +1133,124 @@ def MakePrediction(contributor, apikey, min_events, min_confidence, max_queries,
         
     return(result)
 
-def get_results(contributors_name_file, contributor_name, apikey, min_events, min_confidence, max_queries, output_type, save_path, verbose, incremental):
+def PredictArchived(contributor, archive, min_events, min_confidence, max_queries, verbose, defer_prediction=False, process_pool=None):
+    '''
+    args: contributor (str) - name of the contributor for whom the type needs to be determined
+          archive (dict/EventArchive) - events of each contributor, from the most recent to the oldest (see GHArchive.read_archives
+                                        and EventArchive.get)
+          min_events (int) - minimum number of events that a contributor should have performed to determine their type
+          min_confidence (float) - minimum confidence on contributor type to stop processing further pages of events
+          max_queries (int) - maximum number of pages of 100 events to process
+          verbose (bool) - If True, displays the features, #events and #activities that were used to determine the type of contributor
+          defer_prediction (bool) - If True, the model is not invoked (see MakePrediction)
+          process_pool (ProcessPoolExecutor) - If provided, the events are processed in a process of the pool (see create_process_pool)
+    
+    returns: result (DataFrame) - the result of the contributor, as MakePrediction reports it
+
+    description: Determine the type of the contributor from their archived events, without querying the GitHub API. The events are
+                 split in pages of 100 events as the GitHub Events API reports them. The type of the contributors known by the type
+                 resolver (e.g., GitHub Apps), or archived with the events (see EventArchive.store_type), is reported directly,
+                 the other contributors are considered as User.
+    '''
+
+    contributor_type = type_resolver.resolve(contributor)
+    if(contributor_type is None and isinstance(archive, eva.EventArchive)):
+        contributor_type = archive.get_type(contributor)
+    if(contributor_type == 'Invalid'):
+        result = frame_direct_result(contributor_type, '-', ['type','confidence']+ALL_FEATURES, contributor)
+        return(format_result(result, verbose or defer_prediction))
+    if(contributor_type is not None and contributor_type != 'User'):
+        result = frame_direct_result(contributor_type, 1.0, ['type','confidence']+ALL_FEATURES, contributor)
+        return(format_result(result, verbose or defer_prediction))
+
+    events = archive.get(contributor, [])
+    pages = [(pd.DataFrame.from_dict(eev.unpackJson(events[first:first+100]), orient='columns'), False) for first in range(0, max(len(events), 1), 100)]
+    if(process_pool is not None):
+        return(process_pool.submit(MakePrediction, contributor, None, min_events, min_confidence, max_queries, verbose,
+                                   defer_prediction, pages=pages).result())
+
+    return(MakePrediction(contributor, None, min_events, min_confidence, max_queries, verbose, defer_prediction, pages=pages))
+
+def predict_pending(results, verbose, settings=None):
+    '''
+    args: results (list) - list of DataFrames obtained through MakePrediction with defer_prediction
+          verbose (bool) - If True, displays the features, #events and #activities that were used to determine the type
+          settings (str) - settings with which the results were determined, to store them (see result_settings)
+    
+    returns: results (DataFrame) - formatted results of all the given contributors, in the same order
+
+    description: Batch prediction stage. The contributors whose type still needs to be determined by BIMBAS are
+                 scored together with a single call to the model, then all the results are formatted as per verbose.
+    '''
+
+    results = pd.concat(results)
+    pending = results['type'].isnull().to_numpy()
+    if pending.any():
+        contributor_types, confidences = predict_batch(results[pending])
+        results['type'] = results['type'].astype('object')
+        results['confidence'] = results['confidence'].astype('object')
+        results.loc[pending, 'type'] = contributor_types
+        results.loc[pending, 'confidence'] = confidences
+    store_results(results, settings)
+    results = format_result(results, verbose)
+
+    return(results)
+
+def iter_predictions(contributors, workers, *args, predict=MakePrediction):
+    '''
+    args: contributors (list) - login names of the contributors for which the type needs to be determined
+          workers (int) - number of contributors that are processed at the same time
+          args - the remaining arguments of predict (apikey, min_events, ...)
+          predict (function) - function that determines the type of a contributor, MakePrediction or PredictArchived
+    
+    returns: results (generator) - DataFrame of result obtained through predict for each contributor, in the order of contributors
+
+    description: Determine the type of the contributors one at a time, or with a pool of worker threads so that
+                 many contributors wait on the GitHub API at the same time. Only a bounded number of contributors
+                 is submitted to the pool ahead of the result that is being reported.
+    '''
+
+    if workers <= 1:
+        for contributor in contributors:
+            yield predict(contributor, *args)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = deque()
+            for contributor in contributors:
+                futures.append(executor.submit(predict, contributor, *args))
+                if len(futures) >= 2*workers:
+                    yield futures.popleft().result()
+            while len(futures) > 0:
+                yield futures.popleft().result()
+
+def get_results(contributors_name_file, contributor_name, apikey, min_events, min_confidence, max_queries, output_type, save_path, verbose, incremental, batch_size=1, workers=1, flush_interval=0, checkpoint_path=None, resume=False, prefetch=False, processes=0, archive_paths=None, archive_events=gha.ARCHIVE_EVENTS, from_archive=None):
     '''
     args: contributors_name_file (str) - path to the text file containing contributors names for which the type needs to be determined
           contributor_name (str) - login name of GitHub contributor for which the type needs to be predicted
-          apikey (str) - the API key
+          apikey (str/list) - the API key, or a list of API keys to choose from (see KeyPool)
           min_events (int) - minimum number of events that a contributor should have performed to determine their type.
           min_confidence (float) - minimum confidence on type of contributor to stop further querying
           max_queries (int) - maximum number of queries to be made to GitHub Events API
           verbose (bool) - if True, displays the features that were used to determine the type of contributor
           result (DataFrame) - DataFrame of results
           save_path (str) - the path along with file name and extension to save the results
-          output_type (str) - to convert the results to csv or json 
+          output_type (str) - to convert the results to csv, json or jsonl 
           incremental (bool) - Update the output file/print on terminal once the type is determined for new contributors. If False, results will be accessible only after the type is determined for all the contributors
+          batch_size (int) - number of contributors whose features are scored together with a single call to the model.
+                             Only used when min_confidence is 1.0, since a lower value requires a prediction after each query
+          workers (int) - number of contributors that are processed at the same time, sharing the API rate limit
+          flush_interval (float) - with incremental, minimum time (in seconds) between two writes of the new results to the file
+          checkpoint_path (str) - path of the journal in which the results are recorded as soon as they are determined (see CheckpointJournal)
+          resume (bool) - If True, the contributors recorded in the journal are not processed again, the run goes on from where it stopped
+          prefetch (bool) - If True, the next page of events of a contributor is queried while the current one is processed
+          processes (int) - number of processes that identify the activities, compute the features and run the model, while the
+                            queries are made by the workers of this process. 0 to process the events in the workers.
+          archive_paths (list) - paths of GH Archive files. If provided, the types are determined from the events of these files
+                                 without querying the GitHub API, for all the contributors of the files if no contributor is provided.
+          archive_events (int) - maximum number of most recent events of each contributor read from the GH Archive files
+          from_archive (str) - directory of an event archive (see configure_event_archive). If provided, the types are determined again
+                               from the archived pages of events without querying the GitHub API, for all the archived contributors
+                               if no contributor is provided.
     
     returns: None
 
@@ -381,22 +1261,133 @@ def get_results(contributors_name_file, contributor_name, apikey, min_events, mi
     if len(contributor_name) > 0:
         contributors.extend(contributor_name)
     if contributors_name_file is not None:
-        contributors.extend(pd.read_csv(contributors_name_file, sep=' ', header=None, index_col=0).index.to_list())
-    all_results = pd.DataFrame()
-    for contributor in tqdm(contributors):
-        contributor_type_result = MakePrediction(contributor, apikey, min_events, min_confidence, max_queries, verbose)
-        all_results = pd.concat([all_results, contributor_type_result])
-        if incremental:
-            save_results(all_results, output_type, save_path)
+        contributors.extend(pd.read_csv(contributors_name_file, sep=' ', header=None, index_col=0, dtype=str).index.to_list())
+    archive = None
+    # The processes, files and archive opened by the run are released even if it is interrupted (e.g., by an exception or Ctrl-C)
+    process_pool = None
+    result_writer = None
+    journal = None
+    show_progress_pause = False
+    finished = False
+    try:
+        if archive_paths is not None:
+            archive = gha.read_archives(archive_paths, contributors if len(contributors) > 0 else None, archive_events)
+            if len(contributors) == 0:
+                contributors = sorted(archive)
+            max_queries = math.ceil(archive_events/100)
+        elif from_archive is not None:
+            archive = eva.EventArchive(from_archive, read_only=True) # the pages are only read when the contributor is processed
+            if len(contributors) == 0:
+                contributors = archive.logins()
+            archived = set(archive.logins())
+            missing = [contributor for contributor in contributors if contributor not in archived and type_resolver.resolve(contributor) is None]
+            if len(missing) > 0:
+                warnings.warn(f'{len(missing)} contributors are not in the event archive, they are reported as Unknown: {", ".join(missing[:10])}' +
+                              (', ...' if len(missing) > 10 else ''))
+        # With min_confidence of 1.0, querying never stops early on confidence, so the prediction can be postponed to the batch stage
+        defer_prediction = batch_size > 1 and min_confidence >= 1.0
+        settings = result_settings(min_events, min_confidence, max_queries)
+        if processes > 0:
+            workers = max(workers, processes) # so that there are enough contributors to keep the processes busy
+            process_pool = create_process_pool(processes)
+        key_pool.set_workers(workers)
+        if workers > SESSION_POOL_SIZE:
+            configure_session(pool_size=workers)
+        if prefetch:
+            configure_prefetch(workers)
+        all_results = [] # results of the contributors, only gathered in a DataFrame when they are saved
+        pending_results = []
+        # With incremental, only the new results are appended to the file instead of writing all the results again
+        if incremental and output_type != 'text':
+            result_writer = rwr.ResultWriter(output_type, save_path, flush_interval)
+
+        # The contributors recorded in the checkpoint journal are reported again without being processed
+        completed = 0
+        if checkpoint_path is not None:
+            journal = cpj.CheckpointJournal(checkpoint_path, {'contributors': len(contributors), 'settings': settings, 'verbose': verbose}, resume)
+            completed = len(journal.completed)
+            if [login for login, result in journal.completed] != [str(contributor) for contributor in contributors[:completed]]:
+                raise ValueError(f'The contributors recorded in {checkpoint_path} are not the first provided contributors, the run cannot be resumed.')
+            contributor_type_result = journal.completed_results()
+            if contributor_type_result is not None:
+                if result_writer is not None:
+                    result_writer.write(contributor_type_result)
+                else:
+                    all_results.append(contributor_type_result)
+
+        if archive is not None:
+            predictions = iter_predictions(contributors[completed:], workers, archive, min_events, min_confidence, max_queries, verbose,
+                                           defer_prediction, process_pool, predict=PredictArchived)
+        else:
+            predictions = iter_predictions(contributors[completed:], workers, apikey, min_events, min_confidence, max_queries, verbose,
+                                           defer_prediction, prefetch, process_pool)
+        progress = tqdm(predictions, total=len(contributors), initial=completed)
+        if key_pool.pause_callback is print_pause: # only replace the default callback
+            show_progress_pause = True
+            key_pool.pause_callback = lambda pause_state: show_pause(progress, pause_state)
+        for contributor_type_result in progress:
+            if key_pool.status()['resume_at'] is None:
+                progress.set_postfix_str('', refresh=False)
+            if defer_prediction:
+                pending_results.append(contributor_type_result)
+                if len(pending_results) < batch_size:
+                    continue
+                contributor_type_result = predict_pending(pending_results, verbose, settings)
+                pending_results = []
+            if journal is not None:
+                journal.record(contributor_type_result)
+            if result_writer is not None:
+                result_writer.write(contributor_type_result)
+            else:
+                all_results.append(contributor_type_result)
+                if incremental:
+                    save_results(gather_results(all_results), output_type, save_path)
+
+        if len(pending_results) > 0:
+            contributor_type_result = predict_pending(pending_results, verbose, settings)
+            if journal is not None:
+                journal.record(contributor_type_result)
+            if result_writer is not None:
+                result_writer.write(contributor_type_result)
+            else:
+                all_results.append(contributor_type_result)
+                if incremental:
+                    save_results(gather_results(all_results), output_type, save_path)
+        if result_writer is None and not incremental:
+            save_results(gather_results(all_results), output_type, save_path)
+        finished = True
+    finally:
+        if show_progress_pause:
+            key_pool.pause_callback = print_pause # for the later callers
+        if journal is not None:
+            journal.close()
+        if result_writer is not None:
+            result_writer.close(complete=finished) # FILE.part is left with the results written so far
+        if process_pool is not None:
+            process_pool.shutdown(cancel_futures=not finished)
+        if from_archive is not None and archive is not None:
+            archive.close()
+
+def gather_results(results):
+    '''
+    args: results (list) - list of DataFrames of results
     
-    if not incremental:
-        save_results(all_results, output_type, save_path)
+    returns: all_results (DataFrame) - all the results in a single DataFrame
+
+    description: Gather the results with a single concatenation, instead of concatenating each new result
+                 to all the previous ones, which copies all the previous results again each time.
+    '''
+
+    if len(results) == 0:
+        return(pd.DataFrame())
+
+    return(pd.concat(results))
 
 def save_results(all_results, output_type, save_path):
     '''
     args: all_results (DataFrame)- all the results (contributor name, type, confidence and so on) and additional information (features used to determine the type)
           save_path (str) - the path along with file name and extension to save the results
-          output_type (str) - to convert the results to csv or json
+          output_type (str) - to convert the results to csv, json or jsonl (JSON Lines)
     
     returns: None
 
@@ -418,6 +1409,11 @@ def save_results(all_results, output_type, save_path):
          .reset_index(names=['contributor'])
          .to_json(save_path, orient='records', indent=4)
         )
+    elif(output_type == 'jsonl'):
+        (all_results
+         .reset_index(names=['contributor'])
+         .to_json(save_path, orient='records', lines=True)
+        )
     
 
 def arg_parser():
@@ -443,17 +1439,104 @@ def arg_parser():
         '--max-queries', metavar='MAXQUERIES', type=int, required=False, default=3, choices=[1,2,3],
         help='Maximum number of queries to be made to the GitHub Events API for each contributor. The default number of queries is 3, allowed values are 1, 2 or 3.')
     parser.add_argument(
-        '--key', metavar='APIKEY', required=False, type=str, default='',
-        help='GitHub API key to extract events from GitHub Events API. API key is required if the number of API queries exceed 15 per hour.')
+        '--key', metavar='APIKEY', required=False, type=str, default=[], action='append',
+        help='GitHub API key to extract events from GitHub Events API. API key is required if the number of API queries exceed 15 per hour. \
+Can be repeated to provide several API keys, each query is then made with the API key that has the most remaining queries.')
+    parser.add_argument(
+        '--key-file', metavar='FILE_NAME.txt', required=False, type=str, default=None,
+        help=f'A .txt file with GitHub API keys (one key per line), used together with the API keys provided with --key. \
+If no API key is provided, the API keys are read from the {API_KEYS_VARIABLE} environment variable (separated by commas).')
     parser.add_argument(
         '--csv', metavar='FILE_NAME.csv', required=False, type=str, default='',
         help='Saves the result in comma-separated values (csv) format.')
     parser.add_argument(
         '--json', metavar='FILE_NAME.json', required=False, type=str, default='',
         help='Saves the result in json format.')
+    parser.add_argument(
+        '--jsonl', metavar='FILE_NAME.jsonl', required=False, type=str, default='',
+        help='Saves the result in JSON Lines format (one json record per line).')
     parser.add_argument(
         '--incremental', action="store_true", required=False, default=False, 
         help='Method of reporting the results - incremental/all at once. The default value is False.')
+    parser.add_argument(
+        '--checkpoint', metavar='FILE_NAME.journal', type=str, required=False, default=None,
+        help='Journal in which the result of each contributor is recorded as soon as it is determined, to resume the run if it is interrupted.')
+    parser.add_argument(
+        '--resume', action="store_true", required=False, default=False,
+        help='Resume the run recorded in the --checkpoint journal: the recorded contributors are not processed again. \
+The same contributors and settings as the interrupted run should be provided. The default value is False.')
+    parser.add_argument(
+        '--flush-interval', metavar='SECONDS', type=float, required=False, default=0,
+        help='With --incremental, minimum time in seconds between two writes of the new results to the output file. \
+The default value is 0, the results are written as soon as they are determined.')
+    parser.add_argument(
+        '--batch-size', metavar='BATCH_SIZE', type=int, required=False, default=1,
+        help='Number of contributors whose features are scored together by the model in a single call. It is only used with a minimum confidence of 1.0, \
+with --incremental the results are reported, and with --checkpoint they are recorded, once per batch. The default batch size is 1, each contributor is \
+scored on its own.')
+    parser.add_argument(
+        '--workers', metavar='WORKERS', type=int, required=False, default=1,
+        help='Number of contributors that are processed at the same time. The workers share the rate limit of the API key \
+and the results are reported in the order of the provided contributors. The default number of workers is 1.')
+    parser.add_argument(
+        '--gharchive', metavar='FILE.json.gz', type=str, required=False, default=None, nargs='+',
+        help='GH Archive files (e.g., hourly dumps downloaded from gharchive.org) from which the events of the contributors are read, \
+instead of querying the GitHub API. If no contributor is provided, the type of all the contributors of the files is determined.')
+    parser.add_argument(
+        '--archive-events', metavar='ARCHIVE_EVENTS', type=int, required=False, default=gha.ARCHIVE_EVENTS,
+        help=f'With --gharchive, number of most recent events of each contributor that are used. The default is {gha.ARCHIVE_EVENTS} events, \
+as many as the GitHub Events API reports.')
+    parser.add_argument(
+        '--event-archive', metavar='ARCHIVE_DIR', type=str, required=False, default=None,
+        help='Directory in which every page of events queried from the GitHub API is archived (compressed JSON Lines with an index \
+of the pages of each contributor), so that the types can be determined again with --from-archive. By default, the events are not archived.')
+    parser.add_argument(
+        '--from-archive', metavar='ARCHIVE_DIR', type=str, required=False, default=None,
+        help='Determine the types from the pages of events archived with --event-archive, without querying the GitHub API. \
+If no contributor is provided, the type of all the archived contributors is determined.')
+    parser.add_argument(
+        '--processes', metavar='PROCESSES', type=int, required=False, default=0,
+        help='Number of processes that identify the activities, compute the features and run the model, while the workers query the GitHub API. \
+All the pages of events of a contributor are then queried before processing them. The default value is 0, the events are processed by the workers.')
+    parser.add_argument(
+        '--prefetch', action="store_true", required=False, default=False,
+        help='Query the next page of events of a contributor while the current one is processed. The prefetched page is abandoned \
+if the minimum confidence is reached, which may cost a query of the rate limit. The default value is False.')
+    parser.add_argument(
+        '--cache-dir', metavar='CACHE_DIR', type=str, required=False, default=None,
+        help='Directory in which the GitHub API responses are cached. Cached responses are revalidated with conditional requests, \
+that do not count against the rate limit if the response did not change. By default, the responses are not cached.')
+    parser.add_argument(
+        '--cache-max-size', metavar='CACHE_MAX_SIZE', type=float, required=False, default=rsc.CACHE_MAX_SIZE,
+        help=f'Maximum size of the cache in MB, the least recently used responses are evicted. The default maximum size is {rsc.CACHE_MAX_SIZE} MB.')
+    parser.add_argument(
+        '--cache-max-age', metavar='CACHE_MAX_AGE', type=float, required=False, default=rsc.CACHE_MAX_AGE,
+        help=f'Maximum number of days since a cached response was last used. The default maximum age is {rsc.CACHE_MAX_AGE} days.')
+    parser.add_argument(
+        '--result-store', metavar='FILE_NAME.db', type=str, required=False, default=None,
+        help='SQLite database in which the results are stored. The stored result of a contributor is reused if their newest event, \
+the model and the settings did not change. By default, the results are not stored.')
+    parser.add_argument(
+        '--result-ttl', metavar='RESULT_TTL', type=float, required=False, default=rst.RESULT_TTL,
+        help=f'Number of days during which a stored result is reused. The default is {rst.RESULT_TTL} days.')
+    parser.add_argument(
+        '--refresh', action="store_true", required=False, default=False,
+        help='Determine the type of all the contributors again and replace their stored results. The default value is False.')
+    parser.add_argument(
+        '--event-store', metavar='FILE_NAME.db', type=str, required=False, default=None,
+        help='SQLite database in which the events of the contributors are stored. Only the events that are newer than the stored ones \
+are then queried, and the stored events that the GitHub API does not report anymore are still used. By default, the events are not stored.')
+    parser.add_argument(
+        '--type-cache', metavar='FILE_NAME.db', type=str, required=False, default=None,
+        help='SQLite database in which the types (User, Bot or Organization) reported by the GitHub API are cached, \
+so that the type of a known contributor is not queried again. By default, the types are not cached.')
+    parser.add_argument(
+        '--type-ttl', metavar='TYPE_TTL', type=float, required=False, default=trs.TYPE_TTL,
+        help=f'Number of days during which a cached type is used. The default is {trs.TYPE_TTL} days.')
+    parser.add_argument(
+        '--type-mapping', metavar='FILE_NAME.txt', type=str, required=False, default=None,
+        help='Text file with the known type of contributors, one login name and type (User, Bot or Organization) separated by a space per line. \
+The type of these contributors is not queried.')
 
     return parser.parse_args()
 
@@ -474,14 +1557,28 @@ def cli():
     # else:
     #     time_after = datetime.strftime(datetime.now()+relativedelta(days=-91), '%Y-%m-%d %H:%M:%S')
 
-    if args.key == '' or len(args.key) < 40:
-        warnings.warn('A valid GitHub personal access token is required if more than 60 queries are required to be made per hour. \
+    keys = list(args.key)
+    if args.key_file is not None:
+        with open(args.key_file) as key_file:
+            keys.extend(line.strip() for line in key_file)
+    if len(keys) == 0:
+        keys.extend(os.environ.get(API_KEYS_VARIABLE, '').split(','))
+    keys = [key.strip() for key in keys if len(key.strip()) > 0]
+    valid_keys = list(dict.fromkeys(key for key in keys if len(key) >= 40)) # without duplicates, in the provided order
+    if len(valid_keys) < len(keys):
+        warnings.warn('Some of the provided GitHub API keys are not valid personal access tokens and will not be used.')
+
+    if len(valid_keys) == 0:
+        if args.gharchive is None and args.from_archive is None: # the GitHub API is not queried with archived events
+            warnings.warn('A valid GitHub personal access token is required if more than 60 queries are required to be made per hour. \
 Please read more about it in the repository readme file.')
         apikey = None
+    elif len(valid_keys) == 1:
+        apikey = valid_keys[0]
     else:
-        apikey = args.key
+        apikey = valid_keys
     
-    if args.input_file is None and len(args.contributor) == 0:
+    if args.input_file is None and len(args.contributor) == 0 and args.gharchive is None and args.from_archive is None:
         sys.exit('The login name of a contributor or a .txt file containing login names for contributors should be \
 provided to the tool. Please read more about it in the repository readme file.')
     
@@ -495,16 +1592,68 @@ provided to the tool. Please read more about it in the repository readme file.')
     else:
         min_confidence = args.min_confidence
 
+    if args.resume and args.checkpoint is None:
+        sys.exit('A checkpoint journal (--checkpoint) is required to resume a run.')
+
+    if args.flush_interval < 0:
+        sys.exit('The flush interval should be positive.')
+
+    if args.batch_size < 1:
+        sys.exit('The batch size should be at least 1.')
+
+    if args.workers < 1:
+        sys.exit('The number of workers should be at least 1.')
+
+    if args.processes < 0:
+        sys.exit('The number of processes should be positive.')
+
+    if args.gharchive is not None and args.from_archive is not None:
+        sys.exit('The events can be read either from GH Archive files (--gharchive) or from an event archive (--from-archive), not both.')
+
+    if args.from_archive is not None and not os.path.isdir(args.from_archive):
+        sys.exit(f'There is no event archive in {args.from_archive}.')
+
+    if args.event_archive is not None and args.event_store is not None:
+        sys.exit(EVENT_ARCHIVE_AND_STORE)
+
+    if args.archive_events < 1:
+        sys.exit('The number of events used from the GH Archive files should be at least 1.')
+
+    if args.cache_max_size <= 0 or args.cache_max_age <= 0:
+        sys.exit('The maximum size and the maximum age of the cache should be positive.')
+
+    if args.result_ttl < 0:
+        sys.exit('The number of days during which a stored result is reused should be positive.')
+
+    if args.type_ttl < 0:
+        sys.exit('The number of days during which a cached type is used should be positive.')
+
     if args.csv != '':
         output_type = 'csv'
         save_path = args.csv
     elif args.json != '':
         output_type = 'json'
         save_path = args.json
+    elif args.jsonl != '':
+        output_type = 'jsonl'
+        save_path = args.jsonl
     else:
         output_type = 'text'
         save_path = ''
 
+    preload_model()
+    warm_up_model()
+    if args.cache_dir is not None:
+        configure_cache(args.cache_dir, args.cache_max_size, args.cache_max_age)
+    if args.result_store is not None:
+        configure_result_store(args.result_store, args.result_ttl, args.refresh)
+    if args.type_cache is not None or args.type_mapping is not None:
+        configure_type_resolver(args.type_cache, args.type_mapping, args.type_ttl)
+    if args.event_archive is not None:
+        configure_event_archive(args.event_archive)
+    if args.event_store is not None:
+        configure_event_store(args.event_store)
+
     get_results(args.input_file,
                 args.contributor,
                 apikey, 
@@ -515,7 +1664,17 @@ provided to the tool. Please read more about it in the repository readme file.')
                 output_type,
                 save_path,  
                 args.verbose,
-                args.incremental)
+                args.incremental,
+                args.batch_size,
+                args.workers,
+                args.flush_interval,
+                args.checkpoint,
+                args.resume,
+                args.prefetch,
+                args.processes,
+                args.gharchive,
+                args.archive_events,
+                args.from_archive)
 
 if __name__ == '__main__':
     cli()